@@ -0,0 +1 @@
+"""Benchmarks offline com servidores e repositórios git locais."""
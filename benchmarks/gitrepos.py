@@ -0,0 +1,60 @@
+"""Repositórios git locais (bare) de tamanho configurável."""
+
+import os
+import random
+import subprocess
+from pathlib import Path
+
+WORDS = ['alpha', 'beta', 'gamma', 'delta', 'render', 'export', 'client', 'session',
+         'component', 'layout', 'buffer', 'stream', 'request', 'cache', 'token']
+
+GIT_ENV = {
+    'GIT_AUTHOR_NAME': 'Bench',
+    'GIT_AUTHOR_EMAIL': 'bench@example.com',
+    'GIT_COMMITTER_NAME': 'Bench',
+    'GIT_COMMITTER_EMAIL': 'bench@example.com',
+}
+
+
+def _git(args, cwd):
+    subprocess.run(['git', *args], cwd=cwd, check=True, capture_output=True,
+                   env={**os.environ, **GIT_ENV})
+
+
+def _random_source(rng, lines):
+    return '\n'.join(
+        f"def {rng.choice(WORDS)}_{i}():  # {' '.join(rng.choices(WORDS, k=6))}"
+        for i in range(lines)
+    ) + '\n'
+
+
+def make_bare_repo(root, name='bench', files=200, lines=80, commits=20, seed=42):
+    """Cria ``root/owner/name.git`` e retorna a base para ``GITHUB_BASE_URL``.
+    
+    O repositório tem ``files`` arquivos de ``lines`` linhas, espalhados em
+    ``commits`` commits; a palavra ``needle`` aparece em poucos arquivos.
+    """
+    rng = random.Random(seed)
+    root = Path(root)
+    work = root / 'work' / name
+    bare = root / 'owner' / f'{name}.git'
+    work.mkdir(parents=True)
+    
+    _git(['init', '-q', '-b', 'main'], work)
+    
+    per_commit = max(1, files // commits)
+    for commit in range(commits):
+        for i in range(commit * per_commit, min(files, (commit + 1) * per_commit)):
+            path = work / f'pkg{i % 10}' / f'mod_{i}.py'
+            path.parent.mkdir(exist_ok=True)
+            content = _random_source(rng, lines)
+            if i % 50 == 0:
+                content += '# needle: marcador de busca\n'
+            path.write_text(content)
+        _git(['add', '-A'], work)
+        _git(['commit', '-q', '-m', f'commit {commit}'], work)
+    
+    bare.parent.mkdir(parents=True, exist_ok=True)
+    _git(['clone', '-q', '--bare', str(work), str(bare)], root)
+    
+    return f'file://{root}'
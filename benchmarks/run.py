@@ -0,0 +1,262 @@
+"""Executa os benchmarks offline e grava os resultados em JSON.
+
+Uso (na raiz do repositório):
+
+    python -m benchmarks.run --output bench.json
+    python -m benchmarks.run --latency 50 --bandwidth 2048 --error-rate 0.05
+    python -m benchmarks.run --compare bench-main.json
+"""
+
+import contextlib
+import io
+import json
+import os
+import platform
+import statistics
+import subprocess
+import tempfile
+import time
+from pathlib import Path
+
+import click
+
+from src.tools import client, figclone, image, repo, tracing
+
+from .gitrepos import make_bare_repo
+from .stubs import StubConfig, StubServer
+
+SCENARIOS = ('search_images', 'search_videos', 'export_figma', 'clone_repository', 'search_in_files')
+
+
+def _percentile(values, p):
+    if not values:
+        return None
+    values = sorted(values)
+    return round(values[min(len(values) - 1, int(round(p / 100 * (len(values) - 1))))], 3)
+
+
+def _dir_bytes(path):
+    return sum(f.stat().st_size for f in Path(path).rglob('*') if f.is_file())
+
+
+@contextlib.contextmanager
+def _workdir():
+    """Executa o bloco num diretório temporário (as ferramentas gravam no cwd)."""
+    previous = os.getcwd()
+    with tempfile.TemporaryDirectory(prefix='cli-tools-bench-') as tmp:
+        os.chdir(tmp)
+        try:
+            yield Path(tmp)
+        finally:
+            os.chdir(previous)
+
+
+def _measure(runs, setup, action):
+    """Roda ``action`` ``runs`` vezes e resume tempos e spans HTTP.
+    
+    Uma execução que falha (ex.: downloads que esgotaram os retries com
+    ``--error-rate``) entra em ``failed_runs``/``failures`` e não no tempo;
+    as demais execuções e cenários continuam.
+    """
+    walls = []
+    failures = []
+    items = 0
+    size = 0
+    spans = []
+    
+    for _ in range(runs):
+        with _workdir() as cwd:
+            state = setup(cwd) if setup else None
+            client.close_all()
+            tracing.drain()
+            
+            start = time.perf_counter()
+            try:
+                with contextlib.redirect_stdout(io.StringIO()):
+                    items, size = action(cwd, state)
+            except Exception as e:
+                failures.append(str(e))
+            else:
+                walls.append(time.perf_counter() - start)
+            
+            spans.extend(tracing.drain())
+    
+    http = [s for s in spans if s['kind'] == 'http']
+    latencies = [s['duration_ms'] for s in http]
+    wall = statistics.median(walls) if walls else None
+    
+    return {
+        'runs': runs,
+        'failed_runs': len(failures),
+        'failures': sorted(set(failures)),
+        'wall_s': {'median': round(wall, 4), 'min': round(min(walls), 4), 'max': round(max(walls), 4)} if walls else None,
+        'items': items,
+        'bytes': size,
+        'items_per_s': round(items / wall, 2) if wall else None,
+        'mb_per_s': round(size / (1024 * 1024) / wall, 2) if wall else None,
+        'http': {
+            'requests': len(http) // runs,
+            'p50_ms': _percentile(latencies, 50),
+            'p95_ms': _percentile(latencies, 95),
+            'retries': sum(s.get('retries') or 0 for s in http) // runs,
+            'errors': sum(1 for s in http if s.get('error') or (s.get('status') or 0) >= 400) // runs,
+        },
+    }
+
+
+def run_benchmarks(config, runs=3, images=20, videos=2, files=200, commits=20, scenarios=SCENARIOS):
+    """Executa os cenários pedidos contra os stubs locais."""
+    results = {}
+    tracing.enable()
+    
+    with StubServer(config) as server, tempfile.TemporaryDirectory(prefix='cli-tools-git-') as git_root:
+        # Jobs dos benchmarks não entram no diário do usuário
+        os.environ['CLI_TOOLS_JOBS_DB'] = os.path.join(git_root, 'jobs.db')
+        image.PEXELS_API_KEY = 'bench'
+        image.PEXELS_BASE_URL = f'{server.url}/v1'
+        image.PEXELS_VIDEO_URL = f'{server.url}/videos'
+        figclone.FIGMA_TOKEN = 'bench'
+        figclone.FIGMA_BASE_URL = f'{server.url}/v1'
+        repo.GITHUB_API_URL = server.url
+        repo.GITHUB_BASE_URL = make_bare_repo(git_root, files=files, commits=commits)
+        
+        def search_images(cwd, state):
+            downloaded = image.search_images('benchmark', images)
+            return len(downloaded), _dir_bytes(cwd)
+        
+        def search_videos(cwd, state):
+            downloaded = image.search_videos('benchmark', videos)
+            return len(downloaded), _dir_bytes(cwd)
+        
+        def export_figma(cwd, state):
+            downloaded = figclone.export_figma('benchmarkfile', 'png', 1.0)
+            return len(downloaded), _dir_bytes(cwd)
+        
+        def clone_repository(cwd, state):
+            repo.clone_repository('owner/bench')
+            return files, _dir_bytes(cwd / 'bench')
+        
+        def clone_for_search(cwd):
+            with contextlib.redirect_stdout(io.StringIO()):
+                repo.clone_repository('owner/bench')
+        
+        def search_in_files(cwd, state):
+            found = repo.search_in_files('bench', 'needle')
+            return len(found), _dir_bytes(cwd / 'bench')
+        
+        actions = {
+            'search_images': (None, search_images),
+            'search_videos': (None, search_videos),
+            'export_figma': (None, export_figma),
+            'clone_repository': (None, clone_repository),
+            'search_in_files': (clone_for_search, search_in_files),
+        }
+        
+        for name in scenarios:
+            setup, action = actions[name]
+            results[name] = _measure(runs, setup, action)
+    
+    return results
+
+
+def _git_commit():
+    result = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True)
+    return result.stdout.strip() or None
+
+
+def _print_results(results, baseline=None):
+    from rich.console import Console
+    from rich.table import Table
+    
+    table = Table(show_header=True, header_style="#bd93f9", border_style="#6272a4",
+                  title="[#bd93f9]Benchmarks[/]")
+    table.add_column("Cenário", style="#8be9fd")
+    table.add_column("Mediana", justify="right", style="#f1fa8c")
+    table.add_column("Itens/s", justify="right")
+    table.add_column("MB/s", justify="right")
+    table.add_column("HTTP p50", justify="right")
+    table.add_column("HTTP p95", justify="right")
+    table.add_column("Retries", justify="right")
+    table.add_column("Falhas", justify="right")
+    if baseline:
+        table.add_column("Δ base", justify="right")
+    
+    for name, result in results.items():
+        wall = result['wall_s']
+        failed = result.get('failed_runs', 0)
+        row = [
+            name,
+            f"{wall['median'] * 1000:.1f}ms" if wall else "-",
+            str(result['items_per_s']),
+            str(result['mb_per_s']),
+            f"{result['http']['p50_ms']}ms" if result['http']['p50_ms'] is not None else "-",
+            f"{result['http']['p95_ms']}ms" if result['http']['p95_ms'] is not None else "-",
+            str(result['http']['retries']),
+            f"[#ff5555]{failed}/{result['runs']}[/]" if failed else "-",
+        ]
+        if baseline:
+            old = baseline.get('results', {}).get(name)
+            if old and old.get('wall_s') and wall:
+                change = (result['wall_s']['median'] / old['wall_s']['median'] - 1) * 100
+                color = "#ff5555" if change > 10 else "#50fa7b" if change < -10 else "#f8f8f2"
+                row.append(f"[{color}]{change:+.1f}%[/]")
+            else:
+                row.append("-")
+        table.add_row(*row)
+    
+    Console(stderr=True).print(table)
+
+
+@click.command()
+@click.option('--runs', default=3, help='Execuções por cenário (usa a mediana)')
+@click.option('--latency', default=0, help='Latência simulada por request (ms)')
+@click.option('--bandwidth', default=0, help='Banda simulada por conexão (KB/s, 0 = sem limite)')
+@click.option('--error-rate', default=0.0, help='Fração de respostas 503 simuladas')
+@click.option('--asset-size', default=200, help='Tamanho de cada imagem/export (KB)')
+@click.option('--images', default=20, help='Imagens por busca no Pexels')
+@click.option('--videos', default=2, help='Vídeos por busca no Pexels')
+@click.option('--video-size', default=32, help='Tamanho de cada vídeo (MB)')
+@click.option('--frames', default=10, help='Frames no arquivo Figma simulado')
+@click.option('--files', default=200, help='Arquivos no repositório git local')
+@click.option('--commits', default=20, help='Commits no repositório git local')
+@click.option('--only', 'scenarios', multiple=True, type=click.Choice(SCENARIOS), help='Rodar apenas estes cenários')
+@click.option('--output', '-o', type=click.Path(dir_okay=False), help='Arquivo JSON de saída')
+@click.option('--compare', type=click.Path(exists=True, dir_okay=False), help='JSON de uma execução anterior para comparar')
+def main(runs, latency, bandwidth, error_rate, asset_size, images, videos, video_size, frames,
+         files, commits, scenarios, output, compare):
+    """Benchmarks offline das ferramentas contra servidores locais."""
+    config = StubConfig(latency_ms=latency, bandwidth_kbps=bandwidth, error_rate=error_rate,
+                        asset_size=asset_size * 1024, frames=frames, video_size=video_size * 1024 * 1024)
+    
+    results = run_benchmarks(config, runs=runs, images=images, videos=videos, files=files, commits=commits,
+                             scenarios=scenarios or SCENARIOS)
+    
+    report = {
+        'meta': {
+            'commit': _git_commit(),
+            'timestamp': round(time.time()),
+            'python': platform.python_version(),
+            'platform': f"{platform.system()} {platform.machine()}",
+            'config': {**config.as_dict(), 'runs': runs, 'images': images, 'videos': videos, 'files': files,
+                       'commits': commits},
+        },
+        'results': results,
+    }
+    
+    baseline = None
+    if compare:
+        with open(compare, encoding='utf-8') as f:
+            baseline = json.load(f)
+    
+    _print_results(results, baseline)
+    
+    if output:
+        with open(output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+            f.write('\n')
+    else:
+        click.echo(json.dumps(report))
+
+
+if __name__ == '__main__':
+    main()
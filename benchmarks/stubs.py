@@ -0,0 +1,261 @@
+"""Servidores HTTP locais que imitam as APIs do Pexels, Figma e GitHub."""
+
+import hashlib
+import json
+import os
+import random
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+# Bytes enviados por vez quando a banda é limitada
+CHUNK_SIZE = 16 * 1024
+
+
+class StubConfig:
+    """Comportamento da rede simulada."""
+    
+    def __init__(self, latency_ms=0, bandwidth_kbps=0, error_rate=0.0,
+                 asset_size=200 * 1024, frames=10, video_size=32 * 1024 * 1024, seed=42):
+        self.latency_ms = latency_ms
+        self.bandwidth_kbps = bandwidth_kbps    # 0 = sem limite
+        self.error_rate = error_rate            # fração de respostas 503
+        self.asset_size = asset_size            # bytes por imagem/export
+        self.frames = frames                    # frames no arquivo Figma
+        self.video_size = video_size            # bytes por vídeo (servidos com Range)
+        self.random = random.Random(seed)
+        self.lock = threading.Lock()
+        self.requests = 0
+        self.errors = 0
+    
+    def as_dict(self):
+        return {
+            'latency_ms': self.latency_ms,
+            'bandwidth_kbps': self.bandwidth_kbps,
+            'error_rate': self.error_rate,
+            'asset_size': self.asset_size,
+            'frames': self.frames,
+            'video_size': self.video_size,
+        }
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    
+    def log_message(self, *args):
+        pass
+    
+    @property
+    def config(self):
+        return self.server.config
+    
+    @property
+    def base_url(self):
+        return f'http://{self.server.server_address[0]}:{self.server.server_address[1]}'
+    
+    def _send(self, body, content_type='application/json', status=200, headers=None):
+        if not isinstance(body, bytes):
+            body = json.dumps(body).encode()
+        
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        
+        if self.command == 'HEAD':
+            return
+        
+        # Limitar banda enviando em blocos
+        if not self.config.bandwidth_kbps:
+            self.wfile.write(body)
+            return
+        delay = CHUNK_SIZE / (self.config.bandwidth_kbps * 1024)
+        for start in range(0, len(body), CHUNK_SIZE):
+            self.wfile.write(body[start:start + CHUNK_SIZE])
+            time.sleep(delay)
+    
+    def do_HEAD(self):
+        self.do_GET()
+    
+    def do_GET(self):
+        config = self.config
+        with config.lock:
+            config.requests += 1
+            fail = config.random.random() < config.error_rate
+            if fail:
+                config.errors += 1
+        
+        if config.latency_ms:
+            time.sleep(config.latency_ms / 1000)
+        
+        if fail:
+            return self._send({'error': 'simulated'}, status=503)
+        
+        url = urlsplit(self.path)
+        query = parse_qs(url.query)
+        
+        for pattern, handler in self.routes:
+            match = re.fullmatch(pattern, url.path)
+            if match:
+                return handler(self, query, *match.groups())
+        
+        self._send({'error': 'not found'}, status=404)
+    
+    # Pexels
+    
+    def pexels_search(self, query):
+        per_page = int(query.get('per_page', ['15'])[0])
+        page = int(query.get('page', ['1'])[0])
+        photos = []
+        for i in range(per_page):
+            photo_id = (page - 1) * per_page + i + 1
+            photos.append({
+                'id': photo_id,
+                'width': 6000,
+                'height': 4000 if photo_id % 3 else 6000,
+                'url': f'https://www.pexels.com/photo/{photo_id}/',
+                'photographer': f'Fotógrafo {photo_id % 7}',
+                'photographer_id': photo_id % 7,
+                'avg_color': '#7A6B5C',
+                'alt': f'Foto {photo_id}',
+                'src': {
+                    size: f'{self.base_url}/assets/{photo_id}-{size}.jpg'
+                    for size in ('original', 'large2x', 'large', 'medium', 'small', 'tiny')
+                },
+            })
+        self._send({'page': page, 'per_page': per_page, 'total_results': 10000, 'photos': photos},
+                   headers={'X-Ratelimit-Limit': '20000', 'X-Ratelimit-Remaining': '19999'})
+    
+    def pexels_videos(self, query):
+        per_page = int(query.get('per_page', ['15'])[0])
+        page = int(query.get('page', ['1'])[0])
+        videos = []
+        for i in range(per_page):
+            video_id = (page - 1) * per_page + i + 1
+            videos.append({
+                'id': video_id,
+                'width': 3840,
+                'height': 2160,
+                'duration': 30,
+                'url': f'https://www.pexels.com/video/{video_id}/',
+                'video_files': [{
+                    'id': video_id * 10 + j,
+                    'quality': quality,
+                    'file_type': 'video/mp4',
+                    'width': width,
+                    'height': height,
+                    'fps': 25,
+                    'link': f'{self.base_url}/videos/{video_id}-{height}.mp4',
+                } for j, (quality, width, height) in enumerate(
+                    [('sd', 640, 360), ('hd', 1280, 720), ('hd', 1920, 1080), ('uhd', 3840, 2160)]
+                )],
+            })
+        self._send({'page': page, 'per_page': per_page, 'total_results': 10000, 'videos': videos})
+    
+    # Figma
+    
+    def figma_file(self, query, file_key):
+        frames = [{
+            'id': f'1:{i}',
+            'name': f'Frame {i}',
+            'type': 'FRAME',
+            'absoluteBoundingBox': {'x': 0, 'y': i * 1000, 'width': 1440, 'height': 900},
+            'children': [{
+                'id': f'2:{i}:{j}',
+                'name': f'Texto {j}',
+                'type': 'TEXT',
+                'characters': 'Lorem ipsum dolor sit amet ' * 4,
+            } for j in range(20)],
+        } for i in range(self.config.frames)]
+        document = {
+            'id': '0:0',
+            'name': 'Document',
+            'type': 'DOCUMENT',
+            'children': [{'id': '0:1', 'name': 'Página 1', 'type': 'CANVAS', 'children': frames}],
+        }
+        self._send({'name': f'Arquivo {file_key}', 'document': document, 'components': {}})
+    
+    def figma_images(self, query, file_key):
+        fmt = query.get('format', ['png'])[0]
+        ids = query.get('ids', [''])[0].split(',')
+        self._send({'err': None, 'images': {
+            node_id: f'{self.base_url}/assets/{node_id.replace(":", "-")}.{fmt}' for node_id in ids if node_id
+        }})
+    
+    # GitHub
+    
+    def github_repo(self, query, owner, name):
+        self._send({
+            'id': abs(hash((owner, name))) % 10**8,
+            'name': name,
+            'full_name': f'{owner}/{name}',
+            'owner': {'login': owner},
+            'private': False,
+            'html_url': f'https://github.com/{owner}/{name}',
+            'description': 'Repositório de benchmark',
+            'stargazers_count': 42,
+            'forks_count': 7,
+            'language': 'Python',
+            'default_branch': 'main',
+        }, headers={'X-RateLimit-Remaining': '4999'})
+    
+    # Arquivos
+    
+    def asset(self, query, name):
+        self._send(self.server.asset_bytes, 'application/octet-stream')
+    
+    def video(self, query, name):
+        """Arquivo grande com suporte a Range/If-Range e ETag MD5."""
+        body = self.server.video_bytes
+        headers = {'Accept-Ranges': 'bytes', 'ETag': self.server.video_etag}
+        
+        match = re.fullmatch(r'bytes=(\d+)-(\d*)', self.headers.get('Range', ''))
+        if_range = self.headers.get('If-Range')
+        if not match or (if_range and if_range != self.server.video_etag):
+            return self._send(body, 'video/mp4', headers=headers)
+        
+        start = int(match.group(1))
+        end = min(int(match.group(2) or len(body) - 1), len(body) - 1)
+        headers['Content-Range'] = f'bytes {start}-{end}/{len(body)}'
+        self._send(body[start:end + 1], 'video/mp4', status=206, headers=headers)
+    
+    routes = [
+        (r'/v1/search', pexels_search),
+        (r'/videos/search', pexels_videos),
+        (r'/videos/(.+)', video),
+        (r'/v1/files/([^/]+)', figma_file),
+        (r'/v1/images/([^/]+)', figma_images),
+        (r'/repos/([^/]+)/([^/]+)', github_repo),
+        (r'/assets/(.+)', asset),
+    ]
+
+
+class StubServer:
+    """Servidor local em thread própria; use como context manager."""
+    
+    def __init__(self, config=None, host='127.0.0.1'):
+        self.config = config or StubConfig()
+        self.server = ThreadingHTTPServer((host, 0), _Handler)
+        self.server.daemon_threads = True
+        self.server.config = self.config
+        self.server.asset_bytes = os.urandom(self.config.asset_size)
+        self.server.video_bytes = os.urandom(self.config.video_size)
+        self.server.video_etag = f'"{hashlib.md5(self.server.video_bytes).hexdigest()}"'
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+    
+    @property
+    def url(self):
+        host, port = self.server.server_address[:2]
+        return f'http://{host}:{port}'
+    
+    def __enter__(self):
+        self.thread.start()
+        return self
+    
+    def __exit__(self, *exc):
+        self.server.shutdown()
+        self.server.server_close()
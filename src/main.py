@@ -5,6 +5,56 @@ import click
 import sys
 import os
 
+# Comandos que sempre rodam no próprio processo (nunca via daemon)
+LOCAL_COMMANDS = {'serve', 'dashboard'}
+
+# Variantes que nunca terminam sozinhas (ocupariam o daemon): também locais
+LOCAL_OPTIONS = {'status': {'--watch'}}
+
+# Sequências de teclas reconhecidas no menu (setas em modo normal e "application")
+MENU_KEYS = {
+    '\x1b[A': 'up', '\x1bOA': 'up', 'k': 'up',
+    '\x1b[B': 'down', '\x1bOB': 'down', 'j': 'down',
+    '\r': 'enter', '\n': 'enter',
+    'q': 'quit', '\x03': 'quit',
+}
+
+# Tempo para completar uma sequência de escape partida entre leituras
+ESCAPE_TIMEOUT = 0.05
+
+
+def parse_keys(buffer):
+    """Separa o buffer lido do terminal em teclas.
+    
+    Retorna ``(teclas, resto)``: ``resto`` é o início de uma sequência de
+    escape ainda incompleta, mantido para a próxima leitura. Várias teclas
+    numa mesma leitura (repetição de tecla) são todas entregues.
+    """
+    keys = []
+    i = 0
+    while i < len(buffer):
+        if buffer[i] != '\x1b':
+            keys.append(MENU_KEYS.get(buffer[i]))
+            i += 1
+            continue
+        
+        # ESC [ ... final ou ESC O final
+        if i + 1 >= len(buffer):
+            return [k for k in keys if k], buffer[i:]
+        if buffer[i + 1] not in '[O':
+            i += 1
+            continue
+        j = i + 2
+        while j < len(buffer) and not ('\x40' <= buffer[j] <= '\x7e'):
+            j += 1
+        if j >= len(buffer):
+            return [k for k in keys if k], buffer[i:]
+        keys.append(MENU_KEYS.get(buffer[i:j + 1]))
+        i = j + 1
+    
+    return [k for k in keys if k], ''
+
+
 def show_menu():
     """Menu navegável por setas com tema Dracula."""
     from rich.console import Console
@@ -19,122 +69,117 @@ def show_menu():
 ██║     ██║     ██║       ██║   ██║   ██║██║   ██║██║     ╚════██║
 ╚██████╗███████╗██║       ██║   ╚██████╔╝╚██████╔╝███████╗███████║
  ╚═════╝╚══════╝╚═╝       ╚═╝    ╚═════╝  ╚═════╝ ╚══════╝╚══════╝"""
-    
+ 
     options = [
         "🖼️  Image - Buscar imagens no Pexels",
         "🎨  FigClone - Download de designs do Figma", 
         "📦  Repo - Clonar repositórios do GitHub",
         "📊  Status - Verificar APIs e sistema",
+        "🧵  Dashboard - Jobs em segundo plano",
         "🚪  Sair"
     ]
     
+    def run_tool(index):
+        if index == 0:
+            from .tools.image import run_image_cli
+            run_image_cli()
+        elif index == 1:
+            from .tools.figclone import run_figclone_cli
+            run_figclone_cli()
+        elif index == 2:
+            from .tools.repo import run_repo_cli
+            run_repo_cli()
+        elif index == 3:
+            from .tools.status import show_status_cli
+            show_status_cli()
+        elif index == 4:
+            # Tela cheia própria: volta direto ao menu ao sair
+            from .tools.dashboard import run_dashboard
+            run_dashboard()
+            return
+        console.print("\n  💡 Pressione Enter para voltar ao menu...", style="#6272a4")
+        input()
+    
+    banner_rows = ascii_art.count('\n') + 1
+    banner_width = max(len(line) for line in ascii_art.splitlines())
+    
     selected = 0
+    # Geometria do último desenho completo (ver menu_layout)
+    drawn = {'size': None, 'banner': True, 'first_row': None}
+    
+    def menu_layout():
+        """Decide se a arte cabe e onde fica a primeira opção (linha 1-based).
+        
+        Toda linha do menu é impressa sem quebra (``no_wrap``), então cada uma
+        ocupa exatamente uma linha do terminal. Sem a arte (terminal estreito
+        ou baixo) o cabeçalho é uma linha de título. Se nem assim o menu cabe,
+        ``first_row`` é None: a tela rolaria e as posições absolutas não
+        valeriam mais, então cada movimento redesenha o menu inteiro.
+        """
+        width, height = console.size
+        footer = len(options) + 2
+        banner = width >= banner_width and height >= banner_rows + 2 + footer
+        header = banner_rows + 2 if banner else 2
+        return banner, header + 1 if height >= header + footer else None
+    
+    def print_option(i):
+        if i == selected:
+            # Selecionado: verde Dracula com fundo
+            console.print(f"  ▶ {options[i]}", style="bold #50fa7b on #44475a", end='',
+                          no_wrap=True, overflow='ellipsis')
+        else:
+            # Normal: texto claro Dracula
+            console.print(f"    {options[i]}", style="#f8f8f2", end='', no_wrap=True, overflow='ellipsis')
     
     def print_menu():
-        # Limpar sem piscar
+        # Tela completa: ao abrir, ao voltar de uma ferramenta e quando o terminal muda
         print('\033[2J\033[H', end='')
+        drawn['size'] = console.size
+        drawn['banner'], drawn['first_row'] = menu_layout()
         
-        # ASCII Art em roxo Dracula
-        console.print(ascii_art, style="bold #bd93f9")
-        
-        # Subtítulo centralizado em relação ao ASCII (70 chars)
         subtitle = "v0.1 - Kit de ferramentas para desenvolvedores"
-        padding = (70 - len(subtitle)) // 2
-        console.print(" " * padding + subtitle, style="#6272a4")
+        if drawn['banner']:
+            # ASCII Art em roxo Dracula
+            console.print(ascii_art, style="bold #bd93f9")
+            
+            # Subtítulo centralizado em relação ao ASCII (70 chars)
+            padding = (70 - len(subtitle)) // 2
+            console.print(" " * padding + subtitle, style="#6272a4", no_wrap=True, overflow='ellipsis')
+        else:
+            console.print(f"[bold #bd93f9]CLI Tools[/] [#6272a4]{subtitle}[/]", no_wrap=True, overflow='ellipsis')
         console.print()
         
-        for i, option in enumerate(options):
-            if i == selected:
-                # Selecionado: verde Dracula com fundo
-                console.print(f"  ▶ {option}", style="bold #50fa7b on #44475a")
-            else:
-                # Normal: texto claro Dracula
-                console.print(f"    {option}", style="#f8f8f2")
+        for i in range(len(options)):
+            print_option(i)
+            console.print()
         
         console.print()
-        console.print("  ↑↓ Navegar  Enter Selecionar  q Sair", style="#6272a4")
-    
-    print_menu()
-    
-    while True:
-        try:
-            # Ler tecla sem Enter
-            import termios, tty
-            fd = sys.stdin.fileno()
-            old_settings = termios.tcgetattr(fd)
-            tty.setraw(sys.stdin.fileno())
-            key = sys.stdin.read(1)
-            termios.tcsetattr(fd, termios.TCSADRAIN, old_settings)
-            
-            if key == '\x1b':  # ESC sequence
-                key += sys.stdin.read(2)
-                if key == '\x1b[A':  # Up arrow
-                    selected = (selected - 1) % len(options)
-                    print_menu()
-                elif key == '\x1b[B':  # Down arrow
-                    selected = (selected + 1) % len(options)
-                    print_menu()
-            elif key == '\r' or key == '\n':  # Enter
-                print('\033[2J\033[H', end='')
-                if selected == 0:
-                    from .tools.image import run_image_cli
-                    run_image_cli()
-                    console.print("\n  💡 Pressione Enter para voltar ao menu...", style="#6272a4")
-                    input()
-                    print_menu()
-                elif selected == 1:
-                    from .tools.figclone import run_figclone_cli
-                    run_figclone_cli()
-                    console.print("\n  💡 Pressione Enter para voltar ao menu...", style="#6272a4")
-                    input()
-                    print_menu()
-                elif selected == 2:
-                    from .tools.repo import run_repo_cli
-                    run_repo_cli()
-                    console.print("\n  💡 Pressione Enter para voltar ao menu...", style="#6272a4")
-                    input()
-                    print_menu()
-                elif selected == 3:
-                    from .tools.status import show_status_cli
-                    show_status_cli()
-                    console.print("\n  💡 Pressione Enter para voltar ao menu...", style="#6272a4")
-                    input()
-                    print_menu()
-                elif selected == 4:
-                    console.print("  👋 Até logo!", style="#50fa7b")
-                    break
-            elif key == 'q' or key == '\x03':  # q ou Ctrl+C
-                console.print("  👋 Até logo!", style="#50fa7b")
-                break
-                
-        except (ImportError, OSError):
-            # Fallback para sistemas sem termios
+        console.print("  ↑↓ Navegar  Enter Selecionar  q Sair", style="#6272a4", no_wrap=True,
+                      overflow='ellipsis', end='')
+    
+    def redraw_option(i):
+        # Reescrever só a linha da opção, no lugar
+        sys.stdout.write(f'\033[{drawn["first_row"] + i};1H\033[2K')
+        print_option(i)
+    
+    try:
+        import termios, tty, select
+        fd = sys.stdin.fileno()
+        old_settings = termios.tcgetattr(fd)
+    except (ImportError, OSError, ValueError):
+        old_settings = None
+    
+    if old_settings is None:
+        # Fallback para sistemas sem termios
+        print_menu()
+        while True:
+            console.print()
             console.print("  💡 Use as opções numéricas:", style="#f1fa8c")
-            choice = input("  Escolha (1-4, 0 para sair): ")
+            choice = input("  Escolha (1-5, 0 para sair): ")
             
-            if choice == '1':
-                from .tools.image import run_image_cli
-                run_image_cli()
-                console.print("\n  💡 Pressione Enter para voltar ao menu...", style="#6272a4")
-                input()
-                print_menu()
-            elif choice == '2':
-                from .tools.figclone import run_figclone_cli
-                run_figclone_cli()
-                console.print("\n  💡 Pressione Enter para voltar ao menu...", style="#6272a4")
-                input()
-                print_menu()
-            elif choice == '3':
-                from .tools.repo import run_repo_cli
-                run_repo_cli()
-                console.print("\n  💡 Pressione Enter para voltar ao menu...", style="#6272a4")
-                input()
-                print_menu()
-            elif choice == '4':
-                from .tools.status import show_status_cli
-                show_status_cli()
-                console.print("\n  💡 Pressione Enter para voltar ao menu...", style="#6272a4")
-                input()
+            if choice in ('1', '2', '3', '4', '5'):
+                print('\033[2J\033[H', end='')
+                run_tool(int(choice) - 1)
                 print_menu()
             elif choice == '0':
                 console.print("  👋 Até logo!", style="#50fa7b")
@@ -144,27 +189,188 @@ def show_menu():
                 console.print("  💡 Pressione Enter para continuar...", style="#6272a4")
                 input()
                 print_menu()
+        return
+    
+    def enter_menu_mode():
+        # Sem eco e sem buffer de linha durante toda a navegação;
+        # Ctrl+C ainda gera KeyboardInterrupt e a saída continua com \r\n
+        tty.setcbreak(fd, termios.TCSANOW)
+        sys.stdout.write('\033[?25l')
+        print_menu()
+        sys.stdout.flush()
+    
+    def leave_menu_mode():
+        termios.tcsetattr(fd, termios.TCSADRAIN, old_settings)
+        sys.stdout.write('\033[?25h')
+        sys.stdout.flush()
+    
+    pending = ''
+    try:
+        enter_menu_mode()
+        
+        while True:
+            # Sequência de escape incompleta: esperar só um instante pelo resto
+            timeout = ESCAPE_TIMEOUT if pending else None
+            ready, _, _ = select.select([fd], [], [], timeout)
+            if not ready:
+                # ESC sozinho: descartar
+                pending = ''
+                continue
+            
+            data = os.read(fd, 1024).decode('utf-8', 'ignore')
+            if not data:
+                break
+            keys, pending = parse_keys(pending + data)
+            
+            # Repetição de tecla: aplicar todas e redesenhar uma vez
+            previous = selected
+            action = None
+            for key in keys:
+                if key == 'up':
+                    selected = (selected - 1) % len(options)
+                elif key == 'down':
+                    selected = (selected + 1) % len(options)
+                else:
+                    action = key
+                    break
+            
+            if selected != previous:
+                if drawn['first_row'] is None or console.size != drawn['size']:
+                    # Menu maior que o terminal (ou terminal redimensionado): desenho completo
+                    print_menu()
+                else:
+                    redraw_option(previous)
+                    redraw_option(selected)
+                sys.stdout.flush()
+            
+            if action == 'quit' or (action == 'enter' and selected == len(options) - 1):
+                break
+            if action == 'enter':
+                leave_menu_mode()
+                print('\033[2J\033[H', end='')
+                try:
+                    run_tool(selected)
+                finally:
+                    termios.tcflush(fd, termios.TCIFLUSH)
+                    enter_menu_mode()
+                pending = ''
+    except KeyboardInterrupt:
+        pass
+    finally:
+        leave_menu_mode()
+    
+    # Cursor abaixo do menu antes da despedida
+    if drawn['first_row'] is not None:
+        sys.stdout.write(f'\033[{drawn["first_row"] + len(options) + 2};1H')
+    sys.stdout.write('\n')
+    console.print("  👋 Até logo!", style="#50fa7b")
 
 
 @click.group(invoke_without_command=True)
 @click.version_option(version="0.1.0", prog_name="CLI Tools")
+@click.option('--profile', is_flag=True, help='Mostrar tempos de HTTP, subprocessos e disco ao final')
+@click.option('--trace', type=click.Path(dir_okay=False), help='Gravar spans em arquivo (Chrome trace; .jsonl = um evento por linha)')
 @click.pass_context
-def cli(ctx):
+def cli(ctx, profile, trace):
     """CLI Tools v0.1 - Kit de ferramentas para desenvolvedores."""
+    # Com daemon rodando, o processo atual vira só um cliente fino
+    local = (ctx.invoked_subcommand in LOCAL_COMMANDS
+             or LOCAL_OPTIONS.get(ctx.invoked_subcommand, set()) & set(sys.argv[1:]))
+    if ctx.invoked_subcommand and not local:
+        from .tools import daemon
+        if not daemon.is_serving():
+            exit_code = daemon.forward(sys.argv[1:])
+            if exit_code is not None:
+                ctx.exit(exit_code)
+    
+    if profile or trace:
+        from .tools import tracing
+        tracing.enable()
+        
+        def report():
+            if trace:
+                tracing.write_trace(trace)
+            if profile:
+                tracing.print_summary()
+        
+        ctx.call_on_close(report)
+    
     if ctx.invoked_subcommand is None:
         show_menu()
 
 
 @cli.command()
-@click.argument('query')
+@click.argument('query', required=False)
 @click.option('--count', '-c', default=1, help='Número de imagens')
 @click.option('--orientation', type=click.Choice(['landscape', 'portrait', 'square']))
 @click.option('--size', type=click.Choice(['large', 'medium', 'small']))
 @click.option('--color', help='Cor predominante')
-def image(query, count, orientation, size, color):
-    """Buscar imagens no Pexels."""
+@click.option('--out', type=click.Path(file_okay=False), help='Pasta raiz de saída (padrão: diretório atual)')
+@click.option('--layout', type=click.Choice(['flat', 'hash', 'date']), default='flat', help='Organização dos arquivos em subpastas')
+@click.option('--video', is_flag=True, help='Buscar vídeos em vez de fotos')
+@click.option('--resolution', default=1080, help='Resolução máxima do vídeo (lado menor, ex.: 720/1080/2160)')
+@click.option('--connections', default=4, help='Conexões paralelas por vídeo')
+@click.option('--collection', help='Espelhar uma coleção do Pexels (só fotos novas desde a última vez)')
+@click.option('--curated', is_flag=True, help='Espelhar a curadoria do Pexels (só fotos novas)')
+@click.option('--metadata-only', is_flag=True, help='Só gravar os metadados das fotos, sem baixar imagens')
+@click.option('--format', 'format_type', type=click.Choice(['ndjson', 'csv']), default='ndjson', help='Formato do --metadata-only')
+@click.option('--export', type=click.Path(dir_okay=False), help='Arquivo do --metadata-only (padrão: stdout)')
+@click.option('--min-width', type=int, help='Largura mínima (filtro local do --metadata-only)')
+@click.option('--aspect', help='Proporção, ex.: 16:9 ou 1.5 (filtro local do --metadata-only)')
+@click.option('--from-metadata', type=click.Path(exists=True, dir_okay=False), help='Baixar as fotos de um arquivo do --metadata-only')
+@click.pass_context
+def image(ctx, query, count, orientation, size, color, out, layout, video, resolution, connections,
+          collection, curated, metadata_only, format_type, export, min_width, aspect, from_metadata):
+    """Buscar imagens (ou vídeos, com --video) no Pexels.
+    
+    Com --collection ID ou --curated, espelha o feed em vez de buscar:
+    --count passa a ser opcional e limita as fotos novas baixadas.
+    
+    Com --metadata-only, grava os metadados (NDJSON ou CSV) de todos os
+    resultados sem baixar nada; --from-metadata baixa depois as fotos que
+    ficaram no arquivo.
+    """
+    explicit_count = ctx.get_parameter_source('count') != click.core.ParameterSource.DEFAULT
+    explicit_format = ctx.get_parameter_source('format_type') != click.core.ParameterSource.DEFAULT
+    metadata_options = [name for name, value in (('--format', explicit_format), ('--export', export),
+                                                 ('--min-width', min_width), ('--aspect', aspect)) if value]
+    if metadata_options and not metadata_only:
+        raise click.UsageError(f"{', '.join(metadata_options)} só vale com --metadata-only")
+    
+    if from_metadata:
+        if query or video or collection or curated or metadata_only:
+            raise click.UsageError("Use --from-metadata sozinho (sem QUERY, --video, --collection ou --curated)")
+        from .tools.image import download_from_metadata
+        download_from_metadata(from_metadata, out, layout)
+        return
+    
+    if metadata_only:
+        if not query or video or collection or curated:
+            raise click.UsageError("--metadata-only precisa de QUERY (e não vale com --video/--collection/--curated)")
+        from .tools.image import harvest_metadata
+        harvest_metadata(query, count if explicit_count else None, orientation, size, color,
+                         format_type, export, min_width, aspect)
+        return
+    
+    if collection or curated:
+        if query or video or (collection and curated):
+            raise click.UsageError("Use --collection ou --curated sozinhos (sem QUERY nem --video)")
+        from .tools.image import mirror_feed
+        mirror_feed(collection, count if explicit_count else None, out, layout)
+        return
+    
+    if not query:
+        raise click.UsageError("Informe QUERY (ou use --collection/--curated)")
+    
+    if video:
+        if color:
+            raise click.UsageError("--color não se aplica a vídeos")
+        from .tools.image import search_videos
+        search_videos(query, count, orientation, size, resolution, connections, out, layout)
+        return
+    
     from .tools.image import search_images
-    search_images(query, count, orientation, size, color)
+    search_images(query, count, orientation, size, color, out, layout)
 
 
 @cli.command()
@@ -172,71 +378,136 @@ def image(query, count, orientation, size, color):
 @click.option('--format', '-f', default='png', help='Formato: png/jpg/svg/pdf')
 @click.option('--scale', default=1.0, help='Escala de export')
 @click.option('--nodes', help='IDs dos nodes específicos')
-def figclone(file_key, format, scale, nodes):
+@click.option('--out', type=click.Path(file_okay=False), help='Pasta raiz de saída (padrão: diretório atual)')
+@click.option('--layout', type=click.Choice(['flat', 'hash', 'date']), default='flat', help='Organização dos arquivos em subpastas')
+def figclone(file_key, format, scale, nodes, out, layout):
     """Download de designs do Figma."""
     from .tools.figclone import export_figma
-    export_figma(file_key, format, scale, nodes)
+    export_figma(file_key, format, scale, nodes, out, layout)
 
 
 @cli.command()
 @click.argument('repo')
+@click.argument('repos', nargs=-1)
 @click.option('--query', '-q', help='Buscar nos arquivos')
 @click.option('--depth', type=int, help='Profundidade do clone')
-def repo(repo, query, depth):
-    """Clonar repositório do GitHub."""
+@click.option('--batch', type=click.File('r'), help='Arquivo com um repositório por linha (- para stdin), usado com "info"')
+@click.option('--no-clone', is_flag=True, help='Buscar via tarball em streaming, sem clonar')
+@click.option('--history', is_flag=True, help='Buscar a query no histórico de commits')
+def repo(repo, repos, query, depth, batch, no_clone, history):
+    """Clonar repositório do GitHub.
+    
+    Use "repo info usuario/repo ..." ou "repo info --batch arquivo" para
+    buscar metadados de vários repositórios sem clonar.
+    """
+    if repo == 'info':
+        from .tools.repo import show_repos_info
+        names = list(repos)
+        if batch:
+            names.extend(line.strip() for line in batch if line.strip() and not line.startswith('#'))
+        show_repos_info(names)
+        return
+    
+    if repos:
+        raise click.UsageError("Apenas um repositório pode ser clonado por vez")
+    
+    if no_clone:
+        if not query:
+            raise click.UsageError("--no-clone requer --query")
+        from .tools.repo import search_repository_archive
+        search_repository_archive(repo, query)
+        return
+    
+    if history and not query:
+        raise click.UsageError("--history requer --query")
+    
     from .tools.repo import clone_repository
-    clone_repository(repo, query, depth)
+    clone_repository(repo, query, depth, history)
 
 
 @cli.command()
-def status():
+@click.option('--watch', is_flag=True, help='Monitorar latência das APIs continuamente')
+@click.option('--interval', default=10.0, type=click.FloatRange(min=1), help='Segundos entre amostras no modo --watch')
+@click.option('--export', type=click.Path(dir_okay=False), help='Gravar amostras em JSONL (modo --watch)')
+@click.option('--json', 'as_json', is_flag=True, help='Saída em JSON (sem tabelas)')
+@click.option('--only', type=click.Choice(['apis', 'system', 'folders']), help='Mostrar apenas uma seção')
+@click.option('--refresh', is_flag=True, help='Consultar as APIs de novo em vez de usar o cache (modo --json)')
+def status(watch, interval, export, as_json, only, refresh):
     """Status das APIs e sistema."""
+    if watch:
+        from .tools.status import watch_status
+        watch_status(interval, export)
+        return
+    
+    if as_json:
+        from .tools.status import print_status_json
+        print_status_json(only, refresh)
+        return
+    
     from .tools.status import show_status_cli
-    show_status_cli()
+    show_status_cli(only)
 
 
-if __name__ == "__main__":
-    cli()
+@cli.command()
+def dashboard():
+    """Painel com buscas, exports e clones em segundo plano."""
+    from .tools.dashboard import run_dashboard
+    run_dashboard()
 
 
 @cli.command()
-@click.argument('query')
-@click.option('--count', '-c', default=1, help='Número de imagens')
-@click.option('--orientation', type=click.Choice(['landscape', 'portrait', 'square']))
-@click.option('--size', type=click.Choice(['large', 'medium', 'small']))
-@click.option('--color', help='Cor predominante')
-def search(query, count, orientation, size, color):
-    """Buscar imagens no Pexels."""
-    from .tools.pexels import search_images
-    search_images(query, count, orientation, size, color)
+@click.argument('job_id', type=int, required=False)
+def resume(job_id):
+    """Retomar um download em lote interrompido (padrão: o mais recente)."""
+    from .tools.jobs import resume_job
+    resume_job(job_id)
 
 
 @cli.command()
-@click.argument('file_key')
-@click.option('--format', '-f', default='png', help='Formato: png/jpg/svg/pdf')
-@click.option('--scale', default=1.0, help='Escala de export')
-@click.option('--nodes', help='IDs dos nodes específicos')
-def figma(file_key, format, scale, nodes):
-    """Download de designs do Figma."""
-    from .tools.figma import export_figma
-    export_figma(file_key, format, scale, nodes)
+@click.option('--all', 'include_done', is_flag=True, help='Incluir jobs concluídos')
+def jobs(include_done):
+    """Listar jobs de download ativos e com falhas."""
+    from .tools.jobs import show_jobs
+    show_jobs(include_done)
 
 
 @cli.command()
-@click.argument('repo')
-@click.option('--query', '-q', help='Buscar nos arquivos')
-@click.option('--depth', type=int, help='Profundidade do clone')
-def repo(repo, query, depth):
-    """Clonar repositório do GitHub."""
-    from .tools.repo import clone_repository
-    clone_repository(repo, query, depth)
+@click.argument('directory', default='.', type=click.Path(exists=True, file_okay=False))
+@click.option('--no-repair', is_flag=True, help='Só verificar, sem baixar de novo')
+def verify(directory, no_repair):
+    """Conferir downloads contra o manifesto e baixar de novo os corrompidos."""
+    from .tools.verify import verify_tree
+    verify_tree(directory, repair=not no_repair)
 
 
 @cli.command()
-def status():
-    """Status do sistema."""
-    from .tools.system import show_status
-    show_status()
+@click.option('--stop', is_flag=True, help='Encerrar o daemon em execução')
+@click.option('--detach', is_flag=True, help='Rodar em segundo plano')
+@click.option('--socket', 'socket_path', type=click.Path(dir_okay=False), help='Caminho do socket Unix')
+def serve(stop, detach, socket_path):
+    """Daemon com conexões e imports aquecidos (comandos viram clientes)."""
+    from .tools import daemon
+    
+    if stop:
+        if daemon.stop(socket_path):
+            click.echo("👋 Daemon encerrado")
+        else:
+            click.echo("⭕ Nenhum daemon rodando")
+        return
+    
+    if detach:
+        import subprocess
+        cmd = [sys.executable, '-m', 'src.main', 'serve']
+        if socket_path:
+            cmd.extend(['--socket', socket_path])
+        subprocess.Popen(cmd, cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                         stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL,
+                         stderr=subprocess.DEVNULL, start_new_session=True)
+        click.echo(f"🚀 Daemon iniciado em {socket_path or daemon.socket_path()}")
+        return
+    
+    click.echo(f"🚀 Daemon ouvindo em {socket_path or daemon.socket_path()} (Ctrl+C para sair)")
+    daemon.serve(cli, socket_path)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,100 @@
+"""Client - Camada HTTP compartilhada por todas as ferramentas."""
+
+import random
+import threading
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry, make_headers
+
+from . import tracing
+
+# (connect, read) em segundos; nenhuma chamada fica pendurada para sempre
+DEFAULT_TIMEOUT = (5, 30)
+
+RETRY_TOTAL = 3
+RETRY_BACKOFF = 0.5
+RETRY_STATUS = (429, 500, 502, 503, 504)
+
+# Conexões keep-alive mantidas por host
+POOL_SIZE = 16
+
+# gzip/deflate sempre; br/zstd quando o urllib3 tem o decodificador instalado
+ACCEPT_ENCODING = make_headers(accept_encoding=True)['accept-encoding']
+USER_AGENT = 'cli-tools/0.1.0'
+
+_sessions = {}
+_lock = threading.Lock()
+
+
+class JitterRetry(Retry):
+    """Retry com backoff exponencial e jitter completo (evita rajadas sincronizadas)."""
+    
+    def get_backoff_time(self):
+        backoff = super().get_backoff_time()
+        return random.uniform(0, backoff) if backoff else 0
+
+
+def _build_session(retry):
+    session = requests.Session()
+    session.headers.update({'Accept-Encoding': ACCEPT_ENCODING, 'User-Agent': USER_AGENT})
+    
+    # Apenas métodos idempotentes (GET/HEAD/PUT/DELETE/OPTIONS) são repetidos;
+    # Retry-After de 429/503 é respeitado
+    max_retries = JitterRetry(
+        total=RETRY_TOTAL,
+        backoff_factor=RETRY_BACKOFF,
+        status_forcelist=RETRY_STATUS,
+        raise_on_status=False
+    ) if retry else 0
+    
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=POOL_SIZE, max_retries=max_retries)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
+
+def session_for(url, retry=True):
+    """Sessão keep-alive compartilhada para o host de ``url``."""
+    parts = urlsplit(url)
+    key = (parts.scheme, parts.netloc, retry)
+    
+    session = _sessions.get(key)
+    if session is None:
+        with _lock:
+            session = _sessions.get(key)
+            if session is None:
+                session = _sessions[key] = _build_session(retry)
+    return session
+
+
+def request(method, url, retry=True, **kwargs):
+    """Faz uma requisição pela sessão do host, com timeout e retries padrão.
+    
+    Os headers de autenticação continuam sendo montados por cada
+    ferramenta e passados em ``headers``. ``retry=False`` usa uma sessão
+    sem retries (ex.: verificações com prazo fixo no status).
+    """
+    kwargs.setdefault('timeout', DEFAULT_TIMEOUT)
+    return tracing.request(method, url, session=session_for(url, retry), **kwargs)
+
+
+def get(url, **kwargs):
+    return request('GET', url, **kwargs)
+
+
+def head(url, **kwargs):
+    return request('HEAD', url, **kwargs)
+
+
+def post(url, **kwargs):
+    return request('POST', url, **kwargs)
+
+
+def close_all():
+    """Fecha todas as sessões (e suas conexões)."""
+    with _lock:
+        for session in _sessions.values():
+            session.close()
+        _sessions.clear()
@@ -0,0 +1,349 @@
+"""Daemon - Servidor em socket Unix que mantém sessões e imports aquecidos.
+
+O cliente (``cli-tools`` / ``ct``) só importa este módulo e a stdlib: envia
+os argumentos, o cwd e o tipo de terminal, e repassa a saída recebida.
+Comandos que leem o stdin, ou com tokens/diário diferentes dos que o daemon
+carregou, rodam no próprio processo.
+"""
+
+import json
+import os
+import select
+import shutil
+import signal
+import socket
+import stat
+import sys
+import tempfile
+import threading
+
+# Variáveis de terminal repassadas ao daemon para cada comando
+TERMINAL_ENV = ('TERM', 'COLORTERM', 'NO_COLOR', 'FORCE_COLOR')
+
+# Variáveis que mudam o resultado do comando (tokens, diário de jobs): se as
+# do cliente forem diferentes das que o daemon recebeu ao subir, roda local
+CLIENT_ENV = ('PEXELS_API_KEY', 'FIGMA_TOKEN', 'GITHUB_TOKEN', 'CLI_TOOLS_JOBS_DB', 'XDG_STATE_HOME')
+
+# Tempo máximo para conectar: sem daemon, cair rápido para execução local
+CONNECT_TIMEOUT = 0.2
+
+# Intervalo para notar que o cliente fechou o socket durante um comando
+DISCONNECT_POLL = 0.2
+
+_serving = False
+_launch_env = {}
+
+
+def socket_path():
+    """Caminho do socket (``CLI_TOOLS_SOCKET`` ou um por usuário no runtime dir)."""
+    custom = os.environ.get('CLI_TOOLS_SOCKET')
+    if custom:
+        return custom
+    runtime_dir = os.environ.get('XDG_RUNTIME_DIR') or tempfile.gettempdir()
+    return os.path.join(runtime_dir, f'cli-tools-{os.getuid()}.sock')
+
+
+def is_serving():
+    """True dentro do processo do daemon (evita encaminhar para si mesmo)."""
+    return _serving
+
+
+def _reads_stdin(argv):
+    """True se o comando pode ler o stdin (``-`` nos argumentos, pipe ou arquivo)."""
+    if '-' in argv:
+        return True
+    try:
+        mode = os.fstat(sys.stdin.fileno()).st_mode
+    except (AttributeError, OSError, ValueError):
+        return False
+    return stat.S_ISFIFO(mode) or stat.S_ISREG(mode)
+
+
+def _connect(path=None):
+    path = path or socket_path()
+    if not os.path.exists(path):
+        return None
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    sock.settimeout(CONNECT_TIMEOUT)
+    try:
+        sock.connect(path)
+    except OSError:
+        sock.close()
+        return None
+    sock.settimeout(None)
+    return sock
+
+
+def forward(argv):
+    """Executa ``argv`` no daemon e repassa a saída.
+    
+    Retorna o código de saída, ou None se não houver daemon rodando ou se
+    ele estiver ocupado com outro comando (o chamador então executa o
+    comando no próprio processo).
+    """
+    if os.environ.get('CLI_TOOLS_NO_DAEMON'):
+        return None
+    
+    # O stdin não é repassado ao daemon
+    if _reads_stdin(argv):
+        return None
+    
+    sock = _connect()
+    if sock is None:
+        return None
+    
+    request = {
+        'argv': list(argv),
+        'cwd': os.getcwd(),
+        'tty': sys.stdout.isatty(),
+        'columns': shutil.get_terminal_size().columns,
+        'env': {name: os.environ[name] for name in TERMINAL_ENV if name in os.environ},
+        'client_env': {name: os.environ.get(name) for name in CLIENT_ENV},
+    }
+    
+    with sock, sock.makefile('rwb') as stream:
+        try:
+            stream.write(json.dumps(request).encode() + b'\n')
+            stream.flush()
+            
+            for line in stream:
+                frame = json.loads(line)
+                if 'out' in frame:
+                    sys.stdout.write(frame['out'])
+                    sys.stdout.flush()
+                elif 'err' in frame:
+                    sys.stderr.write(frame['err'])
+                    sys.stderr.flush()
+                elif 'exit' in frame:
+                    return frame['exit']
+                elif frame.get('busy') or frame.get('local'):
+                    # Daemon ocupado (um comando por vez) ou com outro
+                    # ambiente: rodar localmente
+                    return None
+        except KeyboardInterrupt:
+            # O daemon nota o socket fechado e interrompe o comando
+            return 130
+    
+    # Daemon encerrado no meio do comando
+    return 1
+
+
+def stop(path=None):
+    """Pede para o daemon encerrar; retorna False se não havia daemon."""
+    sock = _connect(path)
+    if sock is None:
+        return False
+    with sock:
+        sock.sendall(json.dumps({'stop': True}).encode() + b'\n')
+        sock.recv(1)
+    return True
+
+
+class _FrameWriter:
+    """Arquivo de texto que envia cada escrita como um frame JSON ao cliente."""
+    
+    def __init__(self, stream, channel, lock, tty):
+        self._stream = stream
+        self._channel = channel
+        self._lock = lock
+        self._tty = tty
+    
+    def write(self, text):
+        if text:
+            data = json.dumps({self._channel: text}).encode() + b'\n'
+            with self._lock:
+                self._stream.write(data)
+                self._stream.flush()
+        return len(text)
+    
+    def flush(self):
+        pass
+    
+    def isatty(self):
+        return self._tty
+    
+    @property
+    def encoding(self):
+        return 'utf-8'
+
+
+def _configure_consoles(tty):
+    """Recria os consoles rich das ferramentas para o terminal do cliente."""
+    import rich
+    from rich.console import Console
+    
+    package = __name__.rsplit('.', 1)[0]
+    for name, module in list(sys.modules.items()):
+        if name.startswith(package) and isinstance(getattr(module, 'console', None), Console):
+            module.console = Console(force_terminal=tty)
+    rich.reconfigure(force_terminal=tty)
+
+
+def _run_request(cli, request, stream):
+    """Executa um comando do cliente com cwd, env e saída redirecionados."""
+    import click
+    from . import tracing
+    
+    lock = threading.Lock()
+    out = _FrameWriter(stream, 'out', lock, request.get('tty', False))
+    err = _FrameWriter(stream, 'err', lock, request.get('tty', False))
+    
+    saved_env = {name: os.environ.get(name) for name in TERMINAL_ENV + ('COLUMNS',)}
+    saved_cwd = os.getcwd()
+    saved_streams = sys.stdout, sys.stderr
+    
+    exit_code = 0
+    try:
+        for name in TERMINAL_ENV:
+            os.environ.pop(name, None)
+        os.environ.update(request.get('env', {}))
+        os.environ['COLUMNS'] = str(request.get('columns', 80))
+        os.chdir(request['cwd'])
+        sys.stdout, sys.stderr = out, err
+        _configure_consoles(request.get('tty', False))
+        
+        try:
+            cli.main(args=request['argv'], prog_name='cli-tools', standalone_mode=False)
+        except click.exceptions.Exit as e:
+            exit_code = e.exit_code
+        except click.Abort:
+            err.write("Aborted!\n")
+            exit_code = 1
+        except click.ClickException as e:
+            e.show(file=err)
+            exit_code = e.exit_code
+        except SystemExit as e:
+            exit_code = e.code if isinstance(e.code, int) else 1
+        except (BrokenPipeError, ConnectionResetError):
+            raise
+        except Exception:
+            import traceback
+            err.write(traceback.format_exc())
+            exit_code = 1
+    finally:
+        sys.stdout, sys.stderr = saved_streams
+        os.chdir(saved_cwd)
+        for name, value in saved_env.items():
+            if value is None:
+                os.environ.pop(name, None)
+            else:
+                os.environ[name] = value
+        # --profile/--trace valem só para o comando atual
+        tracing.reset()
+    
+    return exit_code
+
+
+def serve(cli, path=None):
+    """Atende comandos no socket Unix até receber ``stop`` (ou Ctrl+C).
+    
+    Os comandos rodam um por vez na thread principal: cwd, stdout e env são
+    do processo. As conexões são aceitas numa thread à parte, então um
+    cliente que chega com o daemon ocupado recebe ``busy`` e roda o comando
+    localmente, e um cliente que fecha o socket (Ctrl+C, processo morto)
+    interrompe o seu comando mesmo que ele não esteja imprimindo nada.
+    Sessões HTTP do ``client`` e módulos importados continuam aquecidos
+    entre comandos.
+    """
+    global _serving, _launch_env
+    import queue
+    import socketserver
+    
+    path = path or socket_path()
+    if _connect(path) is not None:
+        raise Exception(f"Daemon já está rodando em {path}")
+    if os.path.exists(path):
+        os.unlink(path)
+    
+    # Antes do .env ser carregado pelos imports: é isso que o cliente também vê
+    _launch_env = {name: os.environ.get(name) for name in CLIENT_ENV}
+    
+    # Largura vem de cada cliente, não do terminal do daemon
+    os.environ.pop('COLUMNS', None)
+    os.environ.pop('LINES', None)
+    
+    # Aquecer imports (rich, requests, .env) antes do primeiro comando
+    from . import client, figclone, image, repo, status  # noqa: F401
+    
+    pending = queue.Queue()
+    busy = threading.Lock()
+    # SIGINT enviado pelo próprio daemon (cliente saiu), não pelo usuário
+    interrupting = threading.Event()
+    
+    def interrupt_command():
+        interrupting.set()
+        os.kill(os.getpid(), signal.SIGINT)
+    
+    class Handler(socketserver.StreamRequestHandler):
+        def handle(self):
+            line = self.rfile.readline()
+            if not line:
+                return
+            request = json.loads(line)
+            
+            if request.get('stop'):
+                self.wfile.write(b'.')
+                pending.put(None)
+                if busy.locked():
+                    interrupt_command()
+                return
+            
+            if request.get('client_env', _launch_env) != _launch_env:
+                self.wfile.write(json.dumps({'local': 'env'}).encode() + b'\n')
+                return
+            
+            if not busy.acquire(blocking=False):
+                self.wfile.write(json.dumps({'busy': True}).encode() + b'\n')
+                return
+            
+            try:
+                done = threading.Event()
+                pending.put((request, self.wfile, done))
+                
+                # O cliente não envia mais nada: socket legível é EOF
+                while not done.wait(DISCONNECT_POLL):
+                    readable, _, _ = select.select([self.connection], [], [], 0)
+                    if readable and not self.connection.recv(1, socket.MSG_PEEK):
+                        interrupt_command()
+                        done.wait()
+            finally:
+                busy.release()
+    
+    _serving = True
+    old_umask = os.umask(0o077)
+    try:
+        server = socketserver.ThreadingUnixStreamServer(path, Handler)
+    finally:
+        os.umask(old_umask)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, name='daemon-accept', daemon=True).start()
+    
+    try:
+        while True:
+            try:
+                job = pending.get()
+                if job is None:
+                    break
+                request, stream, done = job
+                interrupting.clear()
+                try:
+                    exit_code = _run_request(cli, request, stream)
+                    stream.write(json.dumps({'exit': exit_code}).encode() + b'\n')
+                except (BrokenPipeError, ConnectionResetError):
+                    # Cliente desconectou (ex.: Ctrl+C)
+                    pass
+                finally:
+                    done.set()
+            except KeyboardInterrupt:
+                # SIGINT de um cliente que saiu chegou fora do comando
+                if not interrupting.is_set():
+                    raise
+    except KeyboardInterrupt:
+        pass
+    finally:
+        _serving = False
+        server.shutdown()
+        server.server_close()
+        if os.path.exists(path):
+            os.unlink(path)
+        client.close_all()
@@ -0,0 +1,296 @@
+"""Dashboard - Painel textual com downloads e clones em segundo plano."""
+
+import os
+import shlex
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from rich.console import Console
+from textual.app import App, ComposeResult
+from textual.containers import Horizontal
+from textual.widgets import Button, DataTable, Footer, Header, Input, RichLog
+
+from . import figclone, image, jobs, repo
+
+console = Console()
+
+# Jobs rodando ao mesmo tempo; os demais esperam na fila
+DASHBOARD_WORKERS = 4
+
+# Intervalo de atualização do painel (segundos)
+REFRESH_INTERVAL = 0.5
+
+QUEUED = "[#6272a4]⏳ Na fila[/]"
+PLANNING = "[#8be9fd]🔍 Planejando[/]"
+RUNNING = "[#8be9fd]📥 Baixando[/]"
+DONE = "[#50fa7b]✅ Concluído[/]"
+FAILED = "[#ff5555]❌ Erro[/]"
+CANCELLED = "[#f1fa8c]⏹️  Cancelado[/]"
+NOT_STARTED = "[#6272a4]⏹️  Não iniciado[/]"
+
+JOB_COLUMNS = (
+    ('id', "#"),
+    ('kind', "Tipo"),
+    ('target', "Alvo"),
+    ('progress', "Progresso"),
+    ('speed', "Vel."),
+    ('errors', "Erros"),
+    ('status', "Status"),
+)
+
+
+class BackgroundJob:
+    """Estado de um job do painel (atualizado pela thread do job)."""
+    
+    def __init__(self, number, kind, target, option):
+        self.number = number
+        self.kind = kind
+        self.target = target
+        self.option = option
+        self.journal_id = None
+        self.future = None
+        self.total = None
+        self.done = 0
+        self.errors = 0
+        self.bytes = 0
+        self.started_at = None
+        self.finished_at = None
+        self.status = QUEUED
+    
+    def count(self):
+        return int(self.option) if self.option.isdigit() else 5
+    
+    def format_type(self):
+        return self.option.lower() if self.option.lower() in ('png', 'jpg', 'svg', 'pdf') else 'png'
+    
+    def depth(self):
+        return int(self.option) if self.option.isdigit() else None
+    
+    def command(self):
+        """Comando equivalente na CLI, para rodar de novo um job que não começou."""
+        if self.kind == 'image':
+            return f"cli-tools image {shlex.quote(self.target)} -c {self.count()}"
+        if self.kind == 'figma':
+            return f"cli-tools figclone {shlex.quote(self.target)} -f {self.format_type()}"
+        depth = self.depth()
+        return f"cli-tools repo {shlex.quote(self.target)}" + (f" --depth {depth}" if depth else "")
+    
+    def progress(self):
+        if self.total is None:
+            return "-"
+        percent = self.done * 100 // self.total if self.total else 100
+        return f"{self.done}/{self.total} ({percent}%)"
+    
+    def speed(self):
+        if not self.started_at or not self.bytes:
+            return "-"
+        elapsed = (self.finished_at or time.monotonic()) - self.started_at
+        return f"{self.bytes / 1024 / max(elapsed, 0.001):.0f}KB/s"
+    
+    def row(self):
+        return (
+            str(self.number),
+            self.kind,
+            self.target,
+            self.progress(),
+            self.speed(),
+            str(self.errors) if self.errors else "-",
+            self.status,
+        )
+
+
+class DashboardApp(App):
+    """Enfileira buscas, exports e clones e acompanha todos ao mesmo tempo."""
+    
+    TITLE = "CLI Tools - Dashboard"
+    
+    CSS = """
+    Screen { background: #282a36; }
+    #form { height: auto; padding: 1 1 0 1; }
+    #target { width: 2fr; }
+    #option { width: 1fr; }
+    Button { margin-left: 1; }
+    #jobs { height: 1fr; margin: 1 1 0 1; }
+    #log { height: 8; margin: 0 1; border: round #6272a4; }
+    """
+    
+    BINDINGS = [
+        ("ctrl+q", "quit", "Sair"),
+        ("ctrl+l", "clear_log", "Limpar log"),
+    ]
+    
+    def __init__(self):
+        super().__init__()
+        self.jobs = []
+        self.rows = {}
+        self.executor = ThreadPoolExecutor(max_workers=DASHBOARD_WORKERS, thread_name_prefix='dashboard')
+        self.stopping = threading.Event()
+        self.saved_consoles = {}
+        # Mensagens das threads dos jobs; o painel as escreve no log a cada refresh
+        self.pending_log = deque()
+    
+    def compose(self) -> ComposeResult:
+        yield Header()
+        with Horizontal(id="form"):
+            yield Input(placeholder="Consulta, File Key ou usuario/repo", id="target")
+            yield Input(placeholder="Qtd / formato / depth", id="option")
+            yield Button("🖼️  Image", id="image", variant="primary")
+            yield Button("🎨 FigClone", id="figma")
+            yield Button("📦 Repo", id="repo")
+        yield DataTable(id="jobs")
+        yield RichLog(id="log", markup=True, wrap=True)
+        yield Footer()
+    
+    def on_mount(self):
+        table = self.query_one("#jobs", DataTable)
+        for key, label in JOB_COLUMNS:
+            table.add_column(label, key=key)
+        
+        # As ferramentas imprimem no próprio console; no painel isso vira ruído
+        devnull = open(os.devnull, 'w')
+        for module in (image, figclone, repo, jobs):
+            self.saved_consoles[module] = module.console
+            module.console = Console(file=devnull)
+        
+        self.set_interval(REFRESH_INTERVAL, self.refresh_jobs)
+        self.query_one("#target", Input).focus()
+    
+    def on_unmount(self):
+        # Downloads em andamento param no próximo arquivo e ficam no diário
+        self.stopping.set()
+    
+    def shutdown(self):
+        """Depois de fechar o painel: espera os jobs pararem e diz o que ficou pendente.
+        
+        Os consoles das ferramentas só voltam ao normal quando nenhum job
+        está rodando, para nada ser impresso por cima do terminal.
+        """
+        self.stopping.set()
+        # Futures ainda na fila (shutdown(cancel_futures=True) só existe no 3.9+)
+        for job in self.jobs:
+            if job.future.cancel():
+                job.status = NOT_STARTED
+        
+        active = [job for job in self.jobs if job.status in (PLANNING, RUNNING)]
+        if active:
+            console.print(f"⏳ [#f1fa8c]Saindo… aguardando {len(active)} job(s) em andamento pararem[/]")
+        self.executor.shutdown(wait=True)
+        
+        for module, saved in self.saved_consoles.items():
+            module.console = saved
+        
+        while self.pending_log:
+            console.print(self.pending_log.popleft())
+        for job in self.jobs:
+            if job.status == CANCELLED and job.journal_id:
+                console.print(f"  ⏸️  [#f1fa8c]Job {job.number} interrompido — continue com:[/] "
+                              f"[#50fa7b]cli-tools resume {job.journal_id}[/]")
+            elif job.status in (NOT_STARTED, CANCELLED):
+                console.print(f"  ⏹️  [#f1fa8c]Job {job.number} não chegou a começar — rode de novo:[/] "
+                              f"[#50fa7b]{job.command()}[/]")
+    
+    def action_clear_log(self):
+        self.query_one("#log", RichLog).clear()
+    
+    def log_message(self, text):
+        self.query_one("#log", RichLog).write(text)
+    
+    def post_log(self, text):
+        """Log a partir da thread de um job (sem bloquear se o painel já fechou)."""
+        self.pending_log.append(text)
+    
+    def on_button_pressed(self, event):
+        target_input = self.query_one("#target", Input)
+        option_input = self.query_one("#option", Input)
+        target = target_input.value.strip()
+        option = option_input.value.strip()
+        
+        if not target:
+            self.log_message("[#ff5555]❌ Informe a consulta, o File Key ou o repositório[/]")
+            return
+        
+        job = BackgroundJob(len(self.jobs) + 1, event.button.id, target, option)
+        self.jobs.append(job)
+        self.rows[job.number] = self.query_one("#jobs", DataTable).add_row(*job.row())
+        job.future = self.executor.submit(self.run_job, job)
+        
+        self.log_message(f"[#6272a4]➕ Job {job.number}: {job.kind} {target}[/]")
+        target_input.value = ""
+        option_input.value = ""
+        target_input.focus()
+    
+    def refresh_jobs(self):
+        while self.pending_log:
+            self.log_message(self.pending_log.popleft())
+        
+        table = self.query_one("#jobs", DataTable)
+        for job in self.jobs:
+            for (key, _), value in zip(JOB_COLUMNS, job.row()):
+                table.update_cell(self.rows[job.number], key, value)
+    
+    def run_job(self, job):
+        """Executa um job numa thread do pool."""
+        if self.stopping.is_set():
+            job.status = NOT_STARTED
+            return
+        
+        job.status = PLANNING
+        job.started_at = time.monotonic()
+        try:
+            if job.kind == 'image':
+                self.run_download(job, *image.plan_search(job.target, job.count()), image.download_photo)
+            elif job.kind == 'figma':
+                self.run_download(job, *figclone.plan_export(job.target, job.format_type()), figclone.download_export)
+            else:
+                job.total = 1
+                job.status = RUNNING
+                repo.clone_repository(job.target, depth=job.depth())
+                job.done = 1
+        except KeyboardInterrupt:
+            job.status = CANCELLED
+            return
+        except Exception as e:
+            job.status = FAILED
+            self.post_log(f"[#ff5555]❌ Job {job.number}: {e}[/]")
+            return
+        finally:
+            job.finished_at = time.monotonic()
+        
+        job.status = DONE
+        self.post_log(f"[#50fa7b]✅ Job {job.number} concluído[/]")
+    
+    def run_download(self, job, journal_id, params, items, download):
+        """Baixa os itens de um job do diário, atualizando o painel."""
+        job.journal_id = journal_id
+        job.total = len(items)
+        job.status = RUNNING
+        output_dir = Path(params['output_dir'])
+        output_dir.mkdir(parents=True, exist_ok=True)
+        
+        def download_item(item):
+            if self.stopping.is_set():
+                # Deixa o item como in_flight: "cli-tools resume" continua depois
+                raise KeyboardInterrupt
+            return download(output_dir, item)
+        
+        def on_done(result):
+            job.done += 1
+            job.bytes += result['bytes']
+        
+        def on_error(item, error):
+            job.errors += 1
+            self.post_log(f"[#ff5555]❌ Job {job.number} {item['filename']}: {error}[/]")
+        
+        jobs.run_items(journal_id, items, download_item, on_done, on_error)
+
+
+def run_dashboard():
+    """Abre o dashboard."""
+    app = DashboardApp()
+    try:
+        app.run()
+    finally:
+        app.shutdown()
@@ -0,0 +1,259 @@
+"""Download - Downloads em streaming com hash e arquivos grandes em faixas (Range) paralelas.
+
+O arquivo é pré-alocado e cada conexão grava sua faixa direto no offset
+certo (``os.pwrite``). Uma faixa que falha é repetida a partir do último
+byte recebido, sem refazer as demais. Servidores sem suporte a Range (ou
+arquivos pequenos) caem para um único stream.
+"""
+
+import hashlib
+import os
+import random
+import re
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+
+import requests
+
+from . import client, tracing
+
+DEFAULT_CONNECTIONS = 4
+
+# Tamanho de cada faixa; arquivos menores que duas faixas vão num stream só
+SEGMENT_SIZE = 8 * 1024 * 1024
+MIN_RANGED_SIZE = 2 * SEGMENT_SIZE
+
+# Leitura/gravação em blocos grandes
+CHUNK_SIZE = 1024 * 1024
+
+SEGMENT_RETRIES = 3
+SEGMENT_BACKOFF = 0.5
+
+# Conteúdo comprimido quebraria os offsets das faixas
+IDENTITY = {'Accept-Encoding': 'identity'}
+
+# ETag que é o MD5 do conteúdo (S3 e afins, sem multipart)
+MD5_ETAG = re.compile(r'^"?([0-9a-f]{32})"?$')
+
+# umask do processo (lida uma vez no import: os.umask só consulta trocando o valor)
+UMASK = os.umask(0)
+os.umask(UMASK)
+
+
+def probe(url):
+    """HEAD seguindo redirects: URL final, tamanho, suporte a Range e ETag."""
+    response = client.head(url, headers=IDENTITY, allow_redirects=True)
+    response.raise_for_status()
+    
+    length = response.headers.get('Content-Length')
+    return {
+        'url': response.url,
+        'size': int(length) if length and length.isdigit() else None,
+        'ranges': response.headers.get('Accept-Ranges', '').lower() == 'bytes',
+        'etag': response.headers.get('ETag'),
+    }
+
+
+def _temp_part(path):
+    """Arquivo temporário único ao lado de ``path`` (``{nome}.{aleatório}.part``).
+    
+    Dois processos baixando o mesmo arquivo (ex.: dois jobs do dashboard)
+    gravam cada um no seu; o último ``os.replace`` vence com um arquivo inteiro.
+    """
+    fd, name = tempfile.mkstemp(dir=path.parent, prefix=path.name + '.', suffix='.part')
+    os.close(fd)
+    # mkstemp cria com 0600: o arquivo final fica com as permissões normais
+    os.chmod(name, 0o666 & ~UMASK)
+    return Path(name)
+
+
+def fetch_to_file(url, path, headers=None, on_bytes=None):
+    """Baixa ``url`` em streaming para ``path``, calculando o SHA-256 no caminho.
+    
+    Confere o ``Content-Length`` (quando a resposta não vem comprimida) e só
+    renomeia o ``.part`` para ``path`` se o tamanho bater. Retorna
+    ``{'bytes', 'sha256'}``.
+    """
+    path = Path(path)
+    part = _temp_part(path)
+    sha256 = hashlib.sha256()
+    size = 0
+    write_ms = 0.0
+    ts = time.time()
+    
+    try:
+        with client.get(url, headers=headers, stream=True) as response:
+            response.raise_for_status()
+            expected = response.headers.get('Content-Length')
+            encoded = response.headers.get('Content-Encoding', 'identity') != 'identity'
+            
+            with open(part, 'wb') as f:
+                for chunk in response.iter_content(CHUNK_SIZE):
+                    start = time.perf_counter()
+                    f.write(chunk)
+                    write_ms += (time.perf_counter() - start) * 1000
+                    sha256.update(chunk)
+                    size += len(chunk)
+                    if on_bytes:
+                        on_bytes(len(chunk))
+        
+        if expected and expected.isdigit() and not encoded and size != int(expected):
+            raise Exception(f"Download incompleto: {size} de {expected} bytes")
+    except BaseException:
+        part.unlink(missing_ok=True)
+        raise
+    
+    os.replace(part, path)
+    tracing.record('disk', 'write', ts, write_ms, path=str(path), bytes=size)
+    return {'bytes': size, 'sha256': sha256.hexdigest()}
+
+
+def download_file(url, path, connections=DEFAULT_CONNECTIONS, on_size=None, on_bytes=None):
+    """Baixa ``url`` para ``path`` e confere tamanho (e MD5 do ETag, se houver).
+    
+    Grava num ``.part`` temporário e só renomeia depois da verificação.
+    Retorna ``{'bytes', 'sha256', 'segments'}``.
+    """
+    path = Path(path)
+    info = probe(url)
+    
+    if on_size and info['size']:
+        on_size(info['size'])
+    
+    part = _temp_part(path)
+    try:
+        if connections > 1 and info['ranges'] and info['size'] and info['size'] >= MIN_RANGED_SIZE:
+            segments = _download_ranged(info, part, connections, on_bytes)
+        else:
+            _download_stream(info['url'], part, on_bytes)
+            segments = 1
+        
+        result = verify_file(part, info['size'], info['etag'])
+    except BaseException:
+        # Arquivo incompleto ou corrompido não fica no disco
+        part.unlink(missing_ok=True)
+        raise
+    
+    os.replace(part, path)
+    return {**result, 'segments': segments}
+
+
+def _download_stream(url, part, on_bytes=None):
+    with client.get(url, headers=IDENTITY, stream=True) as response:
+        response.raise_for_status()
+        with tracing.span('disk', 'write', path=str(part)):
+            with open(part, 'wb') as f:
+                for chunk in response.iter_content(CHUNK_SIZE):
+                    f.write(chunk)
+                    if on_bytes:
+                        on_bytes(len(chunk))
+
+
+def _download_ranged(info, part, connections, on_bytes=None):
+    size = info['size']
+    
+    # Pré-alocar: as faixas gravam fora de ordem sem estender o arquivo
+    with open(part, 'wb') as f:
+        f.truncate(size)
+        if hasattr(os, 'posix_fallocate'):
+            try:
+                os.posix_fallocate(f.fileno(), 0, size)
+            except OSError:
+                pass
+    
+    segments = [(start, min(start + SEGMENT_SIZE, size) - 1) for start in range(0, size, SEGMENT_SIZE)]
+    stop = threading.Event()
+    fd = os.open(part, os.O_WRONLY)
+    try:
+        with ThreadPoolExecutor(max_workers=connections) as executor:
+            futures = [tracing.submit(executor, _fetch_segment, info, fd, start, end, on_bytes, stop)
+                       for start, end in segments]
+            try:
+                for future in as_completed(futures):
+                    future.result()
+            except BaseException:
+                # Uma faixa falhou de vez (ou Ctrl+C): as da fila nem começam,
+                # as em andamento param no próximo bloco
+                stop.set()
+                for pending in futures:
+                    pending.cancel()
+                raise
+    finally:
+        os.close(fd)
+    
+    return len(segments)
+
+
+def _fetch_segment(info, fd, start, end, on_bytes, stop):
+    """Baixa ``bytes=start-end``; ao repetir, continua do último byte gravado."""
+    offset = start
+    
+    for attempt in range(SEGMENT_RETRIES + 1):
+        if stop.is_set():
+            # Outra faixa já falhou: não abrir mais um GET
+            return
+        headers = {**IDENTITY, 'Range': f'bytes={offset}-{end}'}
+        if info['etag'] and not info['etag'].startswith('W/'):
+            # Se o arquivo mudou no servidor, vem 200 com o arquivo inteiro
+            headers['If-Range'] = info['etag']
+        
+        try:
+            with client.get(info['url'], headers=headers, stream=True) as response:
+                response.raise_for_status()
+                if response.status_code != 206:
+                    raise Exception("Servidor ignorou o Range (arquivo mudou durante o download?)")
+                
+                with tracing.span('disk', 'write', path=f'segment {start}-{end}'):
+                    for chunk in response.iter_content(CHUNK_SIZE):
+                        if stop.is_set():
+                            return
+                        chunk = chunk[:end + 1 - offset]
+                        os.pwrite(fd, chunk, offset)
+                        offset += len(chunk)
+                        if on_bytes:
+                            on_bytes(len(chunk))
+            
+            if offset == end + 1:
+                return
+            error = f"{end + 1 - offset} bytes faltando"
+        except requests.HTTPError as e:
+            # 4xx não melhora repetindo (exceto 429)
+            if e.response is not None and e.response.status_code < 500 and e.response.status_code != 429:
+                raise
+            error = str(e)
+        except (requests.RequestException, OSError) as e:
+            error = str(e)
+        
+        if attempt < SEGMENT_RETRIES:
+            # wait() em vez de sleep(): acorda assim que outra faixa falhar
+            stop.wait(random.uniform(0, SEGMENT_BACKOFF * 2 ** attempt))
+    
+    raise Exception(f"Faixa {start}-{end} falhou após {SEGMENT_RETRIES + 1} tentativas: {error}")
+
+
+def verify_file(path, expected_size=None, etag=None):
+    """Confere o tamanho e, com ETag MD5, o conteúdo; retorna bytes e SHA-256."""
+    size = os.path.getsize(path)
+    if expected_size is not None and size != expected_size:
+        raise Exception(f"Tamanho incorreto: {size} bytes, esperado {expected_size}")
+    
+    md5_match = MD5_ETAG.match(etag or '')
+    sha256 = hashlib.sha256()
+    md5 = hashlib.md5() if md5_match else None
+    
+    with open(path, 'rb') as f:
+        while True:
+            block = f.read(CHUNK_SIZE)
+            if not block:
+                break
+            sha256.update(block)
+            if md5:
+                md5.update(block)
+    
+    if md5 and md5.hexdigest() != md5_match.group(1):
+        raise Exception("Checksum não confere com o ETag do servidor")
+    
+    return {'bytes': size, 'sha256': sha256.hexdigest()}
@@ -1,12 +1,16 @@
 """FigClone - Ferramenta de download do Figma."""
 
+import itertools
 import os
-import requests
+import time
 from pathlib import Path
 from rich.console import Console
 from rich.panel import Panel
 from rich.progress import Progress
 
+from . import client, download, jobs, jsonstream
+from . import layout as output_layout
+
 # Carregar variáveis do .env
 try:
     from dotenv import load_dotenv
@@ -19,6 +23,13 @@ console = Console()
 FIGMA_TOKEN = os.getenv('FIGMA_TOKEN', '')
 FIGMA_BASE_URL = 'https://api.figma.com/v1'
 
+# Frames exportados quando nenhum node é informado
+MAX_FRAMES = 10
+
+# Campos guardados de cada node; o resto do documento é descartado na leitura
+NODE_FIELDS = ('id', 'type', 'name')
+TREE_KEYS = frozenset(NODE_FIELDS + ('document', 'children'))
+
 
 def run_figclone_cli():
     """Interface CLI para download do Figma com tema Dracula."""
@@ -104,35 +115,101 @@ def get_file_info(file_key):
         raise Exception("FIGMA_TOKEN não configurado")
     
     headers = {'X-Figma-Token': FIGMA_TOKEN}
-    response = requests.get(f'{FIGMA_BASE_URL}/files/{file_key}', headers=headers)
+    response = client.get(f'{FIGMA_BASE_URL}/files/{file_key}', headers=headers)
     response.raise_for_status()
     return response.json()
 
 
-def export_figma(file_key, format_type="png", scale=1.0, nodes=None):
-    """Exporta designs do Figma."""
+def iter_file_nodes(file_key):
+    """Nodes do documento em pré-ordem: ``{'id', 'type', 'name', 'path'}``.
+    
+    A resposta de ``/files`` é lida em streaming e cada node vira só esses
+    campos (``path`` são os nomes dos ancestrais, da página para baixo),
+    então a memória não cresce com o tamanho do arquivo. Fechar o gerador
+    encerra o download.
+    """
     if not FIGMA_TOKEN:
         raise Exception("FIGMA_TOKEN não configurado")
     
     headers = {'X-Figma-Token': FIGMA_TOKEN}
+    with client.get(f'{FIGMA_BASE_URL}/files/{file_key}', headers=headers, stream=True) as response:
+        response.raise_for_status()
+        yield from _walk_nodes(jsonstream.parse_response(response, keep=TREE_KEYS))
+
+
+def _walk_nodes(events):
+    # Pilha de containers abertos: [node, chave atual] para objetos
+    # (node é None fora da árvore) e [dono] para arrays (dono é o node
+    # cujo "children" está sendo lido, ou None)
+    stack = []
+    for event, value in events:
+        top = stack[-1] if stack else None
+        
+        if event == 'map_key':
+            top[1] = value
+            node = top[0]
+            if value == 'children' and node is not None and 'id' in node and 'type' in node:
+                # Ancestrais antes dos filhos (pré-ordem); se a API mandar os
+                # campos depois de "children", o node sai no fim do objeto
+                node['emitted'] = True
+                yield _node_fields(node)
+        elif event == 'string':
+            node = top[0] if len(top) == 2 else None
+            if node is not None and top[1] in NODE_FIELDS:
+                node[top[1]] = value
+        elif event == 'start_map':
+            node = None
+            if len(stack) == 1 and top[1] == 'document':
+                node = {'path': (), 'emitted': False}
+            elif top is not None and len(top) == 1 and top[0] is not None:
+                owner = top[0]
+                path = () if owner.get('type') == 'DOCUMENT' else owner['path'] + (owner.get('name') or owner.get('id') or '?',)
+                node = {'path': path, 'emitted': False}
+            stack.append([node, None])
+        elif event == 'start_array':
+            owner = top[0] if top is not None and len(top) == 2 and top[1] == 'children' else None
+            stack.append([owner])
+        elif event == 'end_map':
+            node = stack.pop()[0]
+            if node is not None and not node['emitted']:
+                yield _node_fields(node)
+        elif event == 'end_array':
+            stack.pop()
+
+
+def _node_fields(node):
+    return {
+        'id': node.get('id'),
+        'type': node.get('type'),
+        'name': node.get('name'),
+        'path': ' / '.join(node['path']),
+    }
+
+
+def export_figma(file_key, format_type="png", scale=1.0, nodes=None, out=None, layout='flat'):
+    """Exporta designs do Figma.
+    
+    Os arquivos vão para ``{out}/figma`` como
+    ``{file_key}_{node}@{scale}x.{formato}``, organizados segundo ``layout``.
+    """
+    job_id, params, items = plan_export(file_key, format_type, scale, nodes, out, layout)
+    return run_figma_job(job_id, params, items)
+
+
+def plan_export(file_key, format_type="png", scale=1.0, nodes=None, out=None, layout='flat'):
+    """Lista os frames, pede o render e registra o job; retorna ``(job_id, params, itens)``."""
+    if not FIGMA_TOKEN:
+        raise Exception("FIGMA_TOKEN não configurado")
     
     # Se nodes não especificados, buscar todos os frames
     if not nodes:
         console.print("  🔍 [#6272a4]Buscando frames no arquivo...[/]")
         
-        file_info = get_file_info(file_key)
-        node_list = []
-        
-        def extract_nodes(node):
-            if node.get('type') == 'FRAME':
-                node_list.append(node['id'])
-            for child in node.get('children', []):
-                extract_nodes(child)
-        
-        for page in file_info['document']['children']:
-            extract_nodes(page)
-        
-        nodes = node_list[:10]  # Limitar a 10 frames
+        file_nodes = iter_file_nodes(file_key)
+        frames = (node['id'] for node in file_nodes if node['type'] == 'FRAME')
+        # Parar de ler a resposta assim que os frames necessários chegarem
+        nodes = list(itertools.islice(frames, MAX_FRAMES))
+        file_nodes.close()
         console.print(f"  📋 [#50fa7b]Encontrados {len(nodes)} frames[/]")
     else:
         nodes = [n.strip() for n in nodes.split(',') if n.strip()]
@@ -142,58 +219,104 @@ def export_figma(file_key, format_type="png", scale=1.0, nodes=None):
     
     console.print("  🎨 [#6272a4]Solicitando export ao Figma...[/]")
     
-    # Solicitar export
+    images = request_exports(file_key, nodes, format_type, scale)
+    
+    if not images:
+        raise Exception("Nenhuma imagem gerada pelo Figma")
+    
+    output_dir = output_layout.output_dir('figma', out)
+    planned_at = time.time()
+    payloads = [{
+        'node_id': node_id,
+        'url': image_url,
+        'filename': output_layout.file_path(
+            f"{output_layout.safe_id(file_key)}_{output_layout.safe_id(node_id)}@{scale:g}x.{format_type}",
+            layout, planned_at
+        ),
+        'file_key': file_key,
+        'format': format_type,
+        'scale': scale
+    } for node_id, image_url in images.items() if image_url]
+    
+    params = {'file_key': file_key, 'format': format_type, 'scale': scale, 'output_dir': str(output_dir)}
+    job_id = jobs.create_job('figma', f"figclone {file_key} ({len(payloads)} {format_type})", params, payloads)
+    
+    return job_id, params, list(enumerate(payloads))
+
+
+def request_exports(file_key, nodes, format_type="png", scale=1.0):
+    """Pede ao Figma o render dos nodes; retorna ``{node_id: url}``."""
+    headers = {'X-Figma-Token': FIGMA_TOKEN}
+    
     params = {
         'ids': ','.join(nodes),
         'format': format_type,
         'scale': scale
     }
     
-    response = requests.get(f'{FIGMA_BASE_URL}/images/{file_key}', 
+    response = client.get(f'{FIGMA_BASE_URL}/images/{file_key}', 
                           headers=headers, params=params)
     response.raise_for_status()
     
     export_data = response.json()
-    images = export_data.get('images', {})
+    return export_data.get('images', {})
+
+
+def run_figma_job(job_id, params, items, refresh_urls=False):
+    """Baixa os itens pendentes de um job de export do Figma.
     
-    if not images:
-        raise Exception("Nenhuma imagem gerada pelo Figma")
+    As URLs de render do Figma expiram; ao retomar (``refresh_urls``) elas
+    são pedidas de novo, só para os nodes que faltam.
+    """
+    if refresh_urls and items:
+        if not FIGMA_TOKEN:
+            raise Exception("FIGMA_TOKEN não configurado")
+        images = request_exports(params['file_key'], [item['node_id'] for _, item in items],
+                                 params['format'], params['scale'])
+        for _, item in items:
+            item['url'] = images.get(item['node_id']) or item['url']
     
     console.print("  📥 [#6272a4]Baixando arquivos...[/]")
     
     # Criar diretório
-    output_dir = Path('figma')
-    output_dir.mkdir(exist_ok=True)
-    
-    downloaded = []
+    output_dir = Path(params['output_dir'])
+    output_dir.mkdir(parents=True, exist_ok=True)
     
     with Progress() as progress:
-        task = progress.add_task("[#bd93f9]Baixando designs...", total=len(images))
+        task = progress.add_task("[#bd93f9]Baixando designs...", total=len(items))
         
-        for i, (node_id, image_url) in enumerate(images.items()):
-            if not image_url:
-                continue
-            
-            filename = f"figma_export_{i+1}.{format_type}"
-            filepath = output_dir / filename
-            
-            # Download
-            img_response = requests.get(image_url)
-            img_response.raise_for_status()
-            
-            with open(filepath, 'wb') as f:
-                f.write(img_response.content)
-            
-            downloaded.append({
-                'nome': filename,
-                'tamanho': f"{len(img_response.content) // 1024}KB",
-                'node_id': node_id
-            })
-            
-            console.print(f"  📁 [#50fa7b]{filename}[/] [#6272a4]({len(img_response.content) // 1024}KB)[/]")
+        def on_done(result):
+            console.print(f"  📁 [#50fa7b]{result['nome']}[/] [#6272a4]({result['tamanho']})[/]")
             progress.advance(task)
+        
+        return jobs.run_items(job_id, items, lambda item: download_export(output_dir, item), on_done)
+
+
+def download_export(output_dir, item):
+    """Baixa um item planejado para ``output_dir`` (SHA-256 vai para o manifesto)."""
+    filepath = Path(output_dir) / item['filename']
+    filepath.parent.mkdir(parents=True, exist_ok=True)
+    
+    result = download.fetch_to_file(item['url'], filepath)
     
-    return downloaded
+    output_layout.append_manifest(output_dir, {
+        'path': item['filename'],
+        'source': 'figma',
+        'id': item['node_id'],
+        'file_key': item.get('file_key'),
+        'format': item.get('format'),
+        'scale': item.get('scale'),
+        'bytes': result['bytes'],
+        'sha256': result['sha256'],
+        'url': item['url']
+    })
+    
+    return {
+        'nome': item['filename'],
+        'tamanho': f"{result['bytes'] // 1024}KB",
+        'bytes': result['bytes'],
+        'node_id': item['node_id']
+    }
 
 
 def list_components(file_key):
@@ -202,7 +325,7 @@ def list_components(file_key):
         raise Exception("FIGMA_TOKEN não configurado")
     
     headers = {'X-Figma-Token': FIGMA_TOKEN}
-    response = requests.get(f'{FIGMA_BASE_URL}/files/{file_key}/components', headers=headers)
+    response = client.get(f'{FIGMA_BASE_URL}/files/{file_key}/components', headers=headers)
     response.raise_for_status()
     return response.json()
 
@@ -1,12 +1,19 @@
 """Image - Ferramenta de busca de imagens no Pexels."""
 
+import csv
+import json
 import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-import requests
 from rich.console import Console
-from rich.progress import Progress
+from rich.progress import DownloadColumn, Progress, TransferSpeedColumn
 from rich.panel import Panel
 
+from . import client, download, jobs, tracing
+from . import layout as output_layout
+
 # Carregar variáveis do .env
 try:
     from dotenv import load_dotenv
@@ -16,8 +23,12 @@ except ImportError:
 
 console = Console()
 
+# Mensagens do --metadata-only: stdout fica só com os dados
+status_console = Console(stderr=True)
+
 PEXELS_API_KEY = os.getenv('PEXELS_API_KEY', '')
 PEXELS_BASE_URL = 'https://api.pexels.com/v1'
+PEXELS_VIDEO_URL = 'https://api.pexels.com/videos'
 
 
 def run_image_cli():
@@ -91,16 +102,89 @@ def run_image_cli():
         ))
 
 
-def search_images(query, count=1, orientation=None, size=None, color=None):
-    """Busca e baixa imagens do Pexels."""
+# Máximo de fotos por página aceito pela API
+PER_PAGE_MAX = 80
+
+# Páginas pedidas em paralelo ao espelhar coleções e a curadoria
+PAGE_WORKERS = 4
+
+# Requests da cota mantidos em reserva: abaixo disso o espelhamento para
+QUOTA_RESERVE = 10
+
+# Ids do topo do feed guardados como marca d'água da sincronização
+HEAD_SIZE = 20
+
+# Fotos na primeira sincronização da curadoria (o feed não tem fim)
+CURATED_FIRST_SYNC = 400
+
+METADATA_FORMATS = ('ndjson', 'csv')
+
+# Colunas do CSV de metadados; as URLs de ``src`` viram ``src_<tamanho>``
+CSV_FIELDS = (
+    'id', 'width', 'height', 'avg_color', 'alt', 'url', 'liked',
+    'photographer', 'photographer_id', 'photographer_url',
+    'src_original', 'src_large2x', 'src_large', 'src_medium', 'src_small',
+    'src_portrait', 'src_landscape', 'src_tiny',
+)
+
+# Diferença relativa aceita pelo --aspect (16:9 pega 1920x1080 e 1280x722)
+ASPECT_TOLERANCE = 0.02
+
+
+def search_images(query, count=1, orientation=None, size=None, color=None, out=None, layout='flat'):
+    """Busca e baixa imagens do Pexels.
+    
+    A busca vira um job no diário (``jobs``): se a execução for
+    interrompida, ``cli-tools resume`` baixa só o que faltou. Os arquivos
+    vão para ``{out}/imagens`` como ``pexels-{id}.jpg``, organizados
+    segundo ``layout`` (ver ``layout.file_path``).
+    """
+    job_id, params, items = plan_search(query, count, orientation, size, color, out, layout)
+    return run_image_job(job_id, params, items)
+
+
+def _photo_payload(photo_id, url, page_url, query, layout, planned_at):
+    """Item do diário para uma foto (nome determinístico ``pexels-{id}.jpg``)."""
+    return {
+        'id': photo_id,
+        'url': url,
+        'filename': output_layout.file_path(f"pexels-{photo_id}.jpg", layout, planned_at),
+        'page_url': page_url,
+        'query': query
+    }
+
+
+def plan_search(query, count=1, orientation=None, size=None, color=None, out=None, layout='flat'):
+    """Faz a busca e registra o job; retorna ``(job_id, params, itens)``."""
     if not PEXELS_API_KEY:
         raise Exception("PEXELS_API_KEY não configurada")
     
+    photos = fetch_photos(query, count, orientation, size, color)
+    
+    if not photos:
+        raise Exception("Nenhuma imagem encontrada para esta consulta")
+    
+    output_dir = output_layout.output_dir('imagens', out)
+    planned_at = time.time()
+    payloads = [_photo_payload(photo['id'], photo['src']['large2x'], photo['url'], query, layout, planned_at)
+                for photo in photos]
+    
+    params = {'query': query, 'output_dir': str(output_dir)}
+    job_id = jobs.create_job('image', f"image '{query}' ({len(payloads)})", params, payloads)
+    
+    return job_id, params, list(enumerate(payloads))
+
+
+def fetch_photos(query, count, orientation=None, size=None, color=None, endpoint=None, key='photos'):
+    """Pagina a busca até juntar ``count`` fotos (ou acabarem os resultados).
+    
+    ``endpoint``/``key`` permitem usar a mesma paginação na busca de vídeos.
+    """
     headers = {'Authorization': PEXELS_API_KEY}
     
     params = {
         'query': query,
-        'per_page': min(count, 80),
+        'per_page': min(count, PER_PAGE_MAX),
         'page': 1
     }
     
@@ -111,47 +195,456 @@ def search_images(query, count=1, orientation=None, size=None, color=None):
     if color:
         params['color'] = color
     
-    response = requests.get(f'{PEXELS_BASE_URL}/search', headers=headers, params=params)
-    response.raise_for_status()
+    photos = []
+    while len(photos) < count:
+        response = client.get(endpoint or f'{PEXELS_BASE_URL}/search', headers=headers, params=params)
+        response.raise_for_status()
+        
+        data = response.json()
+        page = data.get(key, [])
+        photos.extend(page)
+        
+        if len(page) < params['per_page']:
+            break
+        params['page'] += 1
+    
+    return photos[:count]
+
+
+def run_image_job(job_id, params, items):
+    """Baixa os itens pendentes de um job de imagens."""
+    output_dir = Path(params['output_dir'])
+    output_dir.mkdir(parents=True, exist_ok=True)
+    
+    with Progress() as progress:
+        task = progress.add_task("[#bd93f9]Baixando imagens...", total=len(items))
+        
+        def on_done(result):
+            console.print(f"  📁 [#50fa7b]{result['nome']}[/] [#6272a4]({result['tamanho']})[/]")
+            progress.advance(task)
+        
+        return jobs.run_items(job_id, items, lambda item: download_photo(output_dir, item), on_done)
+
+
+def download_photo(output_dir, item):
+    """Baixa um item planejado para ``output_dir`` (SHA-256 vai para o manifesto)."""
+    filepath = Path(output_dir) / item['filename']
+    filepath.parent.mkdir(parents=True, exist_ok=True)
+    
+    result = download.fetch_to_file(item['url'], filepath)
+    
+    output_layout.append_manifest(output_dir, {
+        'path': item['filename'],
+        'source': 'pexels',
+        'id': item.get('id'),
+        'query': item.get('query'),
+        'bytes': result['bytes'],
+        'sha256': result['sha256'],
+        'url': item['url'],
+        'page_url': item['page_url']
+    })
+    
+    return {
+        'nome': item['filename'],
+        'tamanho': f"{result['bytes'] // 1024}KB",
+        'bytes': result['bytes'],
+        'url': item['page_url']
+    }
+
+
+def search_videos(query, count=1, orientation=None, size=None, resolution=1080,
+                  connections=download.DEFAULT_CONNECTIONS, out=None, layout='flat'):
+    """Busca e baixa vídeos do Pexels.
+    
+    Para cada vídeo é escolhida a versão mais próxima de ``resolution``
+    (lado menor, ex.: 1080 para 1920x1080) sem passar dela; cada arquivo é
+    baixado em ``connections`` faixas paralelas (ver ``download``).
+    """
+    job_id, params, items = plan_video_search(query, count, orientation, size, resolution,
+                                              connections, out, layout)
+    return run_video_job(job_id, params, items)
+
+
+def plan_video_search(query, count=1, orientation=None, size=None, resolution=1080,
+                      connections=download.DEFAULT_CONNECTIONS, out=None, layout='flat'):
+    """Faz a busca de vídeos e registra o job; retorna ``(job_id, params, itens)``."""
+    if not PEXELS_API_KEY:
+        raise Exception("PEXELS_API_KEY não configurada")
+    
+    videos = fetch_photos(query, count, orientation, size, endpoint=f'{PEXELS_VIDEO_URL}/search', key='videos')
+    
+    output_dir = output_layout.output_dir('videos', out)
+    planned_at = time.time()
+    payloads = []
+    for video in videos:
+        rendition = pick_rendition(video, resolution)
+        if not rendition:
+            continue
+        payloads.append({
+            'id': video['id'],
+            'url': rendition['link'],
+            'filename': output_layout.file_path(
+                f"pexels-video-{video['id']}-{_short_side(rendition)}p.mp4", layout, planned_at
+            ),
+            'page_url': video['url'],
+            'width': rendition['width'],
+            'height': rendition['height'],
+            'query': query
+        })
+    
+    if not payloads:
+        raise Exception("Nenhum vídeo encontrado para esta consulta")
+    
+    params = {'query': query, 'output_dir': str(output_dir), 'connections': connections}
+    job_id = jobs.create_job('video', f"video '{query}' ({len(payloads)})", params, payloads)
+    
+    return job_id, params, list(enumerate(payloads))
+
+
+def _short_side(rendition):
+    return min(rendition.get('width') or rendition['height'], rendition['height'])
+
+
+def pick_rendition(video, resolution=1080):
+    """Versão MP4 de maior resolução que não passa de ``resolution``.
+    
+    Se todas passam, fica a menor delas.
+    """
+    files = [f for f in video.get('video_files', []) if f.get('link') and f.get('height')]
+    files = [f for f in files if f.get('file_type') == 'video/mp4'] or files
+    if not files:
+        return None
+    
+    fitting = [f for f in files if _short_side(f) <= resolution]
+    if fitting:
+        return max(fitting, key=lambda f: (_short_side(f), f.get('fps') or 0))
+    return min(files, key=_short_side)
+
+
+def run_video_job(job_id, params, items):
+    """Baixa os itens pendentes de um job de vídeos."""
+    output_dir = Path(params['output_dir'])
+    output_dir.mkdir(parents=True, exist_ok=True)
+    connections = params.get('connections', download.DEFAULT_CONNECTIONS)
+    
+    columns = (*Progress.get_default_columns(), DownloadColumn(), TransferSpeedColumn())
+    with Progress(*columns) as progress:
+        task = progress.add_task("[#bd93f9]Baixando vídeos...", total=None)
+        total_bytes = [0]
+        
+        def add_total(size):
+            # O total cresce conforme cada vídeo informa o tamanho (HEAD)
+            total_bytes[0] += size
+            progress.update(task, total=total_bytes[0])
+        
+        def fetch(item):
+            return download_video(output_dir, item, connections, on_size=add_total,
+                                  on_bytes=lambda n: progress.advance(task, n))
+        
+        def on_done(result):
+            console.print(f"  🎬 [#50fa7b]{result['nome']}[/] [#6272a4]({result['tamanho']}, {result['faixas']} faixas)[/]")
+        
+        return jobs.run_items(job_id, items, fetch, on_done)
+
+
+def download_video(output_dir, item, connections=download.DEFAULT_CONNECTIONS, on_size=None, on_bytes=None):
+    """Baixa um vídeo planejado para ``output_dir`` em faixas paralelas."""
+    filepath = Path(output_dir) / item['filename']
+    filepath.parent.mkdir(parents=True, exist_ok=True)
     
-    data = response.json()
-    photos = data.get('photos', [])
+    result = download.download_file(item['url'], filepath, connections, on_size, on_bytes)
+    
+    output_layout.append_manifest(output_dir, {
+        'path': item['filename'],
+        'source': 'pexels-video',
+        'id': item.get('id'),
+        'query': item.get('query'),
+        'bytes': result['bytes'],
+        'sha256': result['sha256'],
+        'width': item.get('width'),
+        'height': item.get('height'),
+        'url': item['url'],
+        'page_url': item['page_url']
+    })
+    
+    return {
+        'nome': item['filename'],
+        'tamanho': f"{result['bytes'] / (1024 * 1024):.1f}MB",
+        'bytes': result['bytes'],
+        'faixas': result['segments'],
+        'url': item['page_url']
+    }
+
+
+def mirror_feed(collection_id=None, count=None, out=None, layout='flat'):
+    """Espelha uma coleção do Pexels (ou a curadoria, sem ``collection_id``).
+    
+    Só as fotos que ainda não foram espelhadas são baixadas: o diário
+    guarda, por feed, os ids já planejados e o topo do feed na última
+    sincronização completa (com ``count`` cortando as novas, a próxima
+    continua de onde parou). As páginas são pedidas em paralelo (``PAGE_WORKERS``),
+    parando antes de esgotar a cota por hora.
+    """
+    if not PEXELS_API_KEY:
+        raise Exception("PEXELS_API_KEY não configurada")
+    
+    feed = f'collection-{collection_id}' if collection_id else 'curated'
+    state = jobs.get_mirror(feed)
+    
+    if collection_id:
+        photos, head, total = _fetch_collection(collection_id, state)
+        reached_end = True
+    else:
+        # Sem sincronização completa anterior, a curadoria (sem fim) vai até CURATED_FIRST_SYNC
+        watermark = set(state['head']) if state else set()
+        limit = count or (None if watermark else CURATED_FIRST_SYNC)
+        photos, head, reached_end = _fetch_curated(feed, watermark, limit)
+        if not watermark and not count:
+            reached_end = True
+        total = None
+    
+    new_ids = set(jobs.unseen_ids(feed, [photo['id'] for photo in photos]))
+    photos = [photo for photo in photos if photo['id'] in new_ids]
+    
+    # Com --count cortando as novas, topo e total ficam como estavam: a
+    # próxima sincronização continua as que ficaram de fora
+    complete = reached_end and not (count and len(photos) > count)
+    if count:
+        photos = photos[:count]
     
     if not photos:
-        raise Exception("Nenhuma imagem encontrada para esta consulta")
+        jobs.record_mirror(feed, head if complete else None, total, [])
+        console.print(f"  ✅ [#50fa7b]{feed}: nada novo desde a última sincronização[/]")
+        return []
     
-    # Criar diretório
-    output_dir = Path('imagens')
-    output_dir.mkdir(exist_ok=True)
+    console.print(f"  🆕 [#8be9fd]{feed}: {len(photos)} fotos novas[/]")
     
-    downloaded = []
+    output_dir = output_layout.output_dir('imagens', out) / feed
+    planned_at = time.time()
+    payloads = [_photo_payload(photo['id'], photo['src']['large2x'], photo['url'], feed, layout, planned_at)
+                for photo in photos]
     
-    with Progress() as progress:
-        task = progress.add_task("[#bd93f9]Baixando imagens...", total=len(photos[:count]))
+    params = {'query': feed, 'output_dir': str(output_dir)}
+    job_id = jobs.create_job('image', f"mirror {feed} (+{len(payloads)})", params, payloads)
+    
+    # Ids ficam marcados já no planejamento: falhas são retomadas pelo job
+    jobs.record_mirror(feed, head if complete else None, total, [photo['id'] for photo in photos])
+    if not complete:
+        console.print(f"  ⏭️  [#6272a4]{feed}: há mais fotos novas; a próxima sincronização continua delas[/]")
+    
+    return run_image_job(job_id, params, list(enumerate(payloads)))
+
+
+def _get_page(url, page, params=None):
+    """Uma página do feed, parando se a cota por hora estiver no fim."""
+    headers = {'Authorization': PEXELS_API_KEY}
+    response = client.get(url, headers=headers,
+                          params={**(params or {}), 'per_page': PER_PAGE_MAX, 'page': page})
+    response.raise_for_status()
+    
+    remaining = response.headers.get('X-Ratelimit-Remaining')
+    if remaining and remaining.isdigit() and int(remaining) < QUOTA_RESERVE:
+        reset = response.headers.get('X-Ratelimit-Reset')
+        when = time.strftime('%H:%M', time.localtime(int(reset))) if reset and reset.isdigit() else "em breve"
+        raise Exception(f"Cota do Pexels quase esgotada ({remaining} requests restantes, renova {when})")
+    
+    return response.json()
+
+
+def _fetch_pages(url, pages, params=None):
+    """Pede várias páginas em paralelo; retorna as respostas na ordem das páginas."""
+    with ThreadPoolExecutor(max_workers=PAGE_WORKERS) as executor:
+        futures = [tracing.submit(executor, _get_page, url, page, params) for page in pages]
+        return [future.result() for future in futures]
+
+
+def _fetch_collection(collection_id, state):
+    """Todas as fotos da coleção, ou nada se o topo e o total não mudaram."""
+    url = f'{PEXELS_BASE_URL}/collections/{collection_id}'
+    params = {'type': 'photos'}
+    
+    first = _get_page(url, 1, params)
+    media = [item for item in first.get('media', []) if item.get('type', 'Photo') == 'Photo']
+    total = first.get('total_results', len(media))
+    head = [item['id'] for item in media[:HEAD_SIZE]]
+    
+    # Mesmo total e mesmo topo: nada foi adicionado desde a última vez
+    if state and state['total'] == total and state['head'] == head:
+        return [], head, total
+    
+    last_page = -(-total // PER_PAGE_MAX)
+    for data in _fetch_pages(url, range(2, last_page + 1), params):
+        media.extend(item for item in data.get('media', []) if item.get('type', 'Photo') == 'Photo')
+    
+    return media, head, total
+
+
+def _fetch_curated(feed, watermark, limit=None):
+    """Fotos da curadoria ainda não espelhadas, das mais recentes até a marca d'água.
+    
+    ``watermark`` são os ids do topo na última sincronização completa; fotos
+    acima dela já planejadas (sincronizações cortadas por ``--count``) são
+    puladas. Retorna ``(fotos, topo, chegou_na_marca)``: com ``limit``
+    atingido antes da marca, ``chegou_na_marca`` é False.
+    """
+    url = f'{PEXELS_BASE_URL}/curated'
+    photos = []
+    head = None
+    page = 1
+    
+    while True:
+        # Primeira página sozinha: no caso comum (pouco ou nada novo) basta ela
+        size = 1 if page == 1 else PAGE_WORKERS
+        batch = _fetch_pages(url, range(page, page + size))
+        page += size
         
-        for i, photo in enumerate(photos[:count]):
-            # Usar URL de alta qualidade
-            image_url = photo['src']['large2x']
-            filename = f"{query.replace(' ', '_')}_{i+1}.jpg"
-            filepath = output_dir / filename
-            
-            # Download
-            img_response = requests.get(image_url)
-            img_response.raise_for_status()
+        for data in batch:
+            page_photos = data.get('photos', [])
+            if head is None:
+                head = [photo['id'] for photo in page_photos[:HEAD_SIZE]]
             
-            with open(filepath, 'wb') as f:
-                f.write(img_response.content)
+            marked_at = next((i for i, photo in enumerate(page_photos) if photo['id'] in watermark), None)
+            candidates = page_photos if marked_at is None else page_photos[:marked_at]
+            unseen = set(jobs.unseen_ids(feed, [photo['id'] for photo in candidates]))
+            photos.extend(photo for photo in candidates if photo['id'] in unseen)
             
-            downloaded.append({
-                'nome': filename,
-                'tamanho': f"{len(img_response.content) // 1024}KB",
-                'url': photo['url']
-            })
+            if marked_at is not None or len(page_photos) < PER_PAGE_MAX:
+                # Chegou na marca d'água (ou no fim do feed): o resto já foi espelhado
+                return photos, head or [], True
+            if limit and len(photos) >= limit:
+                return photos, head or [], False
+
+
+def harvest_metadata(query, count=None, orientation=None, size=None, color=None,
+                     format_type='ndjson', export=None, min_width=None, aspect=None):
+    """Grava os metadados completos das fotos da busca, sem baixar imagens.
+    
+    Cada foto vira uma linha NDJSON (o objeto da API inteiro) ou CSV
+    (``CSV_FIELDS``) em ``export`` ou no stdout, página a página, para que
+    outra ferramenta possa consumir enquanto a busca continua. As páginas
+    são pedidas em paralelo (``PAGE_WORKERS``). ``min_width`` e ``aspect``
+    (``16:9``, ``4/3`` ou ``1.5``) filtram localmente; ``count`` limita as
+    fotos gravadas (sem ele, vão todos os resultados até a reserva da cota).
+    """
+    if not PEXELS_API_KEY:
+        raise Exception("PEXELS_API_KEY não configurada")
+    if format_type not in METADATA_FORMATS:
+        raise Exception(f"Formato desconhecido: {format_type} (use {', '.join(METADATA_FORMATS)})")
+    
+    ratio = parse_aspect(aspect) if aspect else None
+    url = f'{PEXELS_BASE_URL}/search'
+    params = {'query': query}
+    if orientation:
+        params['orientation'] = orientation
+    if size:
+        params['size'] = size
+    if color:
+        params['color'] = color
+    
+    output = open(export, 'w', encoding='utf-8', newline='') if export else sys.stdout
+    writer = None
+    if format_type == 'csv':
+        writer = csv.DictWriter(output, CSV_FIELDS, extrasaction='ignore')
+        writer.writeheader()
+    
+    seen = set()
+    written = 0
+    page = 1
+    last_page = 1
+    try:
+        while page <= last_page and not (count and written >= count):
+            if page == 1:
+                # Primeira página sozinha: ela diz quantas páginas existem
+                batch = _fetch_pages(url, [1], params)
+                last_page = max(1, -(-batch[0].get('total_results', 0) // PER_PAGE_MAX))
+            else:
+                # Sem filtros, ``count`` diz exatamente quantas páginas faltam
+                wanted = -(-(count - written) // PER_PAGE_MAX) if count and not (min_width or ratio) else PAGE_WORKERS
+                batch = _fetch_pages(url, range(page, min(page + min(wanted, PAGE_WORKERS), last_page + 1)), params)
+            page += len(batch)
             
-            console.print(f"  📁 [#50fa7b]{filename}[/] [#6272a4]({len(img_response.content) // 1024}KB)[/]")
-            progress.advance(task)
+            for data in batch:
+                page_photos = data.get('photos', [])
+                for photo in page_photos:
+                    # Resultados de páginas vizinhas podem se repetir
+                    if photo['id'] in seen or not _matches(photo, min_width, ratio):
+                        continue
+                    seen.add(photo['id'])
+                    if writer:
+                        writer.writerow({**photo, **{f'src_{name}': src for name, src in photo.get('src', {}).items()}})
+                    else:
+                        output.write(json.dumps(photo, ensure_ascii=False) + '\n')
+                    written += 1
+                    if count and written >= count:
+                        break
+                
+                if len(page_photos) < PER_PAGE_MAX or (count and written >= count):
+                    last_page = 0
+                    break
+            output.flush()
+    except BrokenPipeError:
+        # Quem lia o stdout fechou o pipe (ex.: ``| head``): parar de paginar
+        if output is sys.__stdout__:
+            os.dup2(os.open(os.devnull, os.O_WRONLY), output.fileno())
+    finally:
+        if export:
+            output.close()
+    
+    target = export or 'stdout'
+    status_console.print(f"  📋 [#50fa7b]{written} fotos[/] [#6272a4]({page - 1} pág.) → {target}[/]")
+    return written
+
+
+def parse_aspect(value):
+    """Proporção de ``16:9``, ``16/9`` ou ``1.78``."""
+    try:
+        for separator in (':', '/', 'x'):
+            if separator in value:
+                width, height = value.split(separator)
+                return float(width) / float(height)
+        return float(value)
+    except (ValueError, ZeroDivisionError):
+        raise Exception(f"Proporção inválida: {value} (use 16:9, 4/3 ou 1.5)")
+
+
+def _matches(photo, min_width=None, ratio=None):
+    width = photo.get('width') or 0
+    height = photo.get('height') or 0
+    if min_width and width < min_width:
+        return False
+    if ratio and (not height or abs(width / height - ratio) > ratio * ASPECT_TOLERANCE):
+        return False
+    return True
+
+
+def download_from_metadata(path, out=None, layout='flat'):
+    """Baixa as fotos listadas num arquivo do ``--metadata-only`` (NDJSON ou CSV).
+    
+    Serve para a segunda etapa da curadoria: filtrar/editar o arquivo e
+    baixar só as fotos que ficaram.
+    """
+    source = Path(path).name
+    planned_at = time.time()
+    
+    with open(path, encoding='utf-8', newline='') as f:
+        first = f.read(1)
+        f.seek(0)
+        if first == '{':
+            rows = [json.loads(line) for line in f if line.strip()]
+            payloads = [_photo_payload(row['id'], row['src']['large2x'], row['url'], source, layout, planned_at)
+                        for row in rows]
+        else:
+            payloads = [_photo_payload(int(row['id']), row['src_large2x'], row['url'], source, layout, planned_at)
+                        for row in csv.DictReader(f)]
+    
+    if not payloads:
+        raise Exception(f"Nenhuma foto em {path}")
+    
+    output_dir = output_layout.output_dir('imagens', out)
+    params = {'query': source, 'output_dir': str(output_dir)}
+    job_id = jobs.create_job('image', f"image --from-metadata {source} ({len(payloads)})", params, payloads)
     
-    return downloaded
+    return run_image_job(job_id, params, list(enumerate(payloads)))
 
 
 def get_collections():
@@ -160,7 +653,7 @@ def get_collections():
         raise Exception("PEXELS_API_KEY não configurada")
     
     headers = {'Authorization': PEXELS_API_KEY}
-    response = requests.get(f'{PEXELS_BASE_URL}/collections/featured', headers=headers)
+    response = client.get(f'{PEXELS_BASE_URL}/collections/featured', headers=headers)
     response.raise_for_status()
     return response.json()
 
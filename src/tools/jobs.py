@@ -0,0 +1,378 @@
+"""Jobs - Diário SQLite de downloads em lote, para retomar execuções interrompidas.
+
+Cada job guarda os parâmetros e a lista planejada de itens (um por
+arquivo). Os itens passam por ``pending`` → ``in_flight`` → ``done`` ou
+``failed``; ao retomar, só os que não chegaram a ``done`` são refeitos,
+sem repetir a busca na API.
+
+O mesmo banco guarda o estado dos espelhamentos de coleções/curadoria do
+Pexels (``mirrors``): o topo do feed na última sincronização e os ids já
+baixados, para que a próxima execução busque só o que é novo.
+"""
+
+import json
+import os
+import sqlite3
+import time
+from contextlib import closing
+from pathlib import Path
+from rich.console import Console
+from rich.table import Table
+
+console = Console()
+
+PENDING = 'pending'
+IN_FLIGHT = 'in_flight'
+DONE = 'done'
+FAILED = 'failed'
+
+# Estados do job
+RUNNING = 'running'
+INTERRUPTED = 'interrupted'
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    kind TEXT NOT NULL,
+    description TEXT NOT NULL,
+    params TEXT NOT NULL,
+    status TEXT NOT NULL,
+    pid INTEGER,
+    created_at REAL NOT NULL,
+    updated_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS items (
+    job_id INTEGER NOT NULL REFERENCES jobs(id) ON DELETE CASCADE,
+    seq INTEGER NOT NULL,
+    payload TEXT NOT NULL,
+    state TEXT NOT NULL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    error TEXT,
+    updated_at REAL NOT NULL,
+    PRIMARY KEY (job_id, seq)
+);
+CREATE INDEX IF NOT EXISTS items_state ON items (job_id, state);
+CREATE TABLE IF NOT EXISTS mirrors (
+    feed TEXT PRIMARY KEY,
+    head TEXT NOT NULL,
+    total INTEGER,
+    synced_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS mirror_media (
+    feed TEXT NOT NULL,
+    media_id INTEGER NOT NULL,
+    PRIMARY KEY (feed, media_id)
+);
+"""
+
+# Ids por consulta IN (...) (limite de variáveis do SQLite)
+SQL_BATCH = 500
+
+# Bancos cujo schema (e modo WAL, que fica gravado no arquivo) já foi criado
+# neste processo: o executescript roda uma vez, não a cada conexão
+_initialized = set()
+
+STATUS_LABELS = {
+    RUNNING: "[#8be9fd]🔄 Rodando[/]",
+    INTERRUPTED: "[#f1fa8c]⏸️  Interrompido[/]",
+    FAILED: "[#ff5555]❌ Com falhas[/]",
+    DONE: "[#50fa7b]✅ Concluído[/]",
+}
+
+
+def db_path():
+    """Caminho do diário (``CLI_TOOLS_JOBS_DB`` ou ``~/.local/state/cli-tools``)."""
+    custom = os.environ.get('CLI_TOOLS_JOBS_DB')
+    if custom:
+        return Path(custom)
+    state_home = os.environ.get('XDG_STATE_HOME') or Path.home() / '.local' / 'state'
+    return Path(state_home) / 'cli-tools' / 'jobs.db'
+
+
+def _connect():
+    path = db_path()
+    fresh = str(path) not in _initialized or not path.exists()
+    if fresh:
+        path.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(path, timeout=10)
+    conn.row_factory = sqlite3.Row
+    conn.execute('PRAGMA foreign_keys=ON')
+    if fresh:
+        conn.execute('PRAGMA journal_mode=WAL')
+        conn.executescript(SCHEMA)
+        _initialized.add(str(path))
+    return conn
+
+
+def create_job(kind, description, params, payloads):
+    """Registra um job com seus itens planejados e retorna o id."""
+    now = time.time()
+    with closing(_connect()) as conn, conn:
+        cursor = conn.execute(
+            'INSERT INTO jobs (kind, description, params, status, pid, created_at, updated_at) '
+            'VALUES (?, ?, ?, ?, ?, ?, ?)',
+            (kind, description, json.dumps(params), RUNNING, os.getpid(), now, now)
+        )
+        job_id = cursor.lastrowid
+        conn.executemany(
+            'INSERT INTO items (job_id, seq, payload, state, updated_at) VALUES (?, ?, ?, ?, ?)',
+            [(job_id, seq, json.dumps(payload), PENDING, now) for seq, payload in enumerate(payloads)]
+        )
+    return job_id
+
+
+def get_job(job_id):
+    """Job com parâmetros decodificados e contagem de itens por estado."""
+    with closing(_connect()) as conn:
+        row = conn.execute('SELECT * FROM jobs WHERE id = ?', (job_id,)).fetchone()
+        if row is None:
+            return None
+        counts = dict(conn.execute(
+            'SELECT state, COUNT(*) FROM items WHERE job_id = ? GROUP BY state', (job_id,)
+        ).fetchall())
+    return _job_dict(row, counts)
+
+
+def _job_dict(row, counts):
+    job = dict(row)
+    job['params'] = json.loads(job['params'])
+    job['counts'] = {state: counts.get(state, 0) for state in (PENDING, IN_FLIGHT, DONE, FAILED)}
+    job['total'] = sum(job['counts'].values())
+    
+    # Processo morto (kill -9, OOM) sem ter atualizado o status
+    if job['status'] == RUNNING and not _pid_alive(job['pid']):
+        job['status'] = INTERRUPTED
+    return job
+
+
+def _pid_alive(pid):
+    if not pid:
+        return False
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def list_jobs(include_done=False):
+    """Jobs mais recentes primeiro (por padrão, só os não concluídos)."""
+    with closing(_connect()) as conn:
+        rows = conn.execute('SELECT * FROM jobs ORDER BY id DESC').fetchall()
+        counts = {}
+        for job_id, state, n in conn.execute('SELECT job_id, state, COUNT(*) FROM items GROUP BY job_id, state'):
+            counts.setdefault(job_id, {})[state] = n
+    
+    jobs = [_job_dict(row, counts.get(row['id'], {})) for row in rows]
+    if not include_done:
+        jobs = [job for job in jobs if job['status'] != DONE]
+    return jobs
+
+
+def unfinished_items(job_id):
+    """Itens que ainda precisam ser baixados: ``(seq, payload)``.
+    
+    Itens ``in_flight`` são de uma execução interrompida no meio do
+    download e voltam para a fila junto com os pendentes e os que falharam.
+    """
+    with closing(_connect()) as conn:
+        rows = conn.execute(
+            'SELECT seq, payload FROM items WHERE job_id = ? AND state != ? ORDER BY seq',
+            (job_id, DONE)
+        ).fetchall()
+    return [(row['seq'], json.loads(row['payload'])) for row in rows]
+
+
+def start_job(job_id):
+    """Marca o job como rodando neste processo (ao retomar)."""
+    with closing(_connect()) as conn, conn:
+        conn.execute('UPDATE jobs SET status = ?, pid = ?, updated_at = ? WHERE id = ?',
+                     (RUNNING, os.getpid(), time.time(), job_id))
+
+
+def mark_item(job_id, seq, state, error=None, conn=None):
+    """Atualiza o estado de um item (commit imediato: sobrevive a Ctrl+C).
+    
+    ``conn`` reaproveita uma conexão aberta (``run_items`` usa uma por job).
+    """
+    if conn is None:
+        with closing(_connect()) as conn:
+            return mark_item(job_id, seq, state, error, conn)
+    
+    attempts = 1 if state == IN_FLIGHT else 0
+    with conn:
+        conn.execute(
+            'UPDATE items SET state = ?, error = ?, attempts = attempts + ?, updated_at = ? '
+            'WHERE job_id = ? AND seq = ?',
+            (state, error, attempts, time.time(), job_id, seq)
+        )
+
+
+def finish_job(job_id, interrupted=False):
+    """Fecha o job: ``done`` se todos os itens concluíram, senão ``failed``."""
+    with closing(_connect()) as conn, conn:
+        remaining = conn.execute(
+            'SELECT COUNT(*) FROM items WHERE job_id = ? AND state != ?', (job_id, DONE)
+        ).fetchone()[0]
+        if interrupted:
+            status = INTERRUPTED
+        else:
+            status = FAILED if remaining else DONE
+        conn.execute('UPDATE jobs SET status = ?, updated_at = ? WHERE id = ?',
+                     (status, time.time(), job_id))
+    return status
+
+
+def run_items(job_id, items, download, on_done=None, on_error=None):
+    """Executa ``download(payload)`` para cada item, registrando o estado.
+    
+    Falhas de um item não interrompem os demais (``on_error`` recebe o
+    payload e a exceção; sem ele, o erro é impresso); Ctrl+C deixa o item
+    atual como ``in_flight`` e o job como interrompido. Retorna a lista
+    de resultados dos itens concluídos.
+    """
+    results = []
+    failed = 0
+    
+    try:
+        # Uma conexão para o job inteiro; cada mudança de estado ainda é um commit
+        with closing(_connect()) as conn:
+            for seq, payload in items:
+                mark_item(job_id, seq, IN_FLIGHT, conn=conn)
+                try:
+                    result = download(payload)
+                except Exception as e:
+                    failed += 1
+                    mark_item(job_id, seq, FAILED, error=str(e), conn=conn)
+                    if on_error:
+                        on_error(payload, e)
+                    else:
+                        console.print(f"  ❌ [#ff5555]{payload.get('filename', seq)}: {e}[/]")
+                    continue
+                mark_item(job_id, seq, DONE, conn=conn)
+                results.append(result)
+                if on_done:
+                    on_done(result)
+    except KeyboardInterrupt:
+        finish_job(job_id, interrupted=True)
+        console.print(f"\n  ⏸️  [#f1fa8c]Job {job_id} interrompido — continue com:[/] [#50fa7b]cli-tools resume {job_id}[/]")
+        raise
+    except BaseException:
+        # Ex.: cliente do daemon desconectou no meio do job
+        finish_job(job_id, interrupted=True)
+        raise
+    
+    finish_job(job_id)
+    if failed:
+        raise Exception(f"{failed} de {len(items)} downloads falharam — tente de novo com: cli-tools resume {job_id}")
+    return results
+
+
+def resume_job(job_id=None):
+    """Retoma um job (por padrão, o mais recente não concluído)."""
+    if job_id is None:
+        pending = list_jobs()
+        if not pending:
+            raise Exception("Nenhum job pendente para retomar")
+        job = pending[0]
+    else:
+        job = get_job(job_id)
+        if job is None:
+            raise Exception(f"Job {job_id} não encontrado")
+    
+    if job['status'] == DONE:
+        console.print(f"  ✅ [#50fa7b]Job {job['id']} já está concluído[/]")
+        return []
+    if job['status'] == RUNNING:
+        raise Exception(f"Job {job['id']} ainda está rodando (pid {job['pid']})")
+    
+    items = unfinished_items(job['id'])
+    console.print(f"  🔁 [#8be9fd]Retomando job {job['id']}[/] [#f8f8f2]{job['description']}[/] "
+                  f"[#6272a4]({len(items)} de {job['total']} itens restantes)[/]")
+    
+    start_job(job['id'])
+    
+    if job['kind'] == 'image':
+        from .image import run_image_job
+        return run_image_job(job['id'], job['params'], items)
+    if job['kind'] == 'video':
+        from .image import run_video_job
+        return run_video_job(job['id'], job['params'], items)
+    if job['kind'] == 'figma':
+        from .figclone import run_figma_job
+        return run_figma_job(job['id'], job['params'], items, refresh_urls=True)
+    raise Exception(f"Tipo de job desconhecido: {job['kind']}")
+
+
+def get_mirror(feed):
+    """Estado da última sincronização de ``feed`` (ou None se nunca rodou)."""
+    with closing(_connect()) as conn:
+        row = conn.execute('SELECT * FROM mirrors WHERE feed = ?', (feed,)).fetchone()
+    if row is None:
+        return None
+    return {'head': json.loads(row['head']), 'total': row['total'], 'synced_at': row['synced_at']}
+
+
+def unseen_ids(feed, media_ids):
+    """Os ids de ``media_ids`` ainda não espelhados, na mesma ordem."""
+    media_ids = list(media_ids)
+    seen = set()
+    with closing(_connect()) as conn:
+        for start in range(0, len(media_ids), SQL_BATCH):
+            batch = media_ids[start:start + SQL_BATCH]
+            placeholders = ','.join('?' * len(batch))
+            seen.update(row[0] for row in conn.execute(
+                f'SELECT media_id FROM mirror_media WHERE feed = ? AND media_id IN ({placeholders})',
+                (feed, *batch)
+            ))
+    return [media_id for media_id in media_ids if media_id not in seen]
+
+
+def record_mirror(feed, head, total, media_ids):
+    """Grava o novo topo do feed e os ids planejados nesta sincronização.
+    
+    Com ``head`` None (sincronização incompleta) só os ids são gravados:
+    topo e total continuam os da última sincronização completa.
+    """
+    with closing(_connect()) as conn, conn:
+        if head is not None:
+            conn.execute(
+                'INSERT INTO mirrors (feed, head, total, synced_at) VALUES (?, ?, ?, ?) '
+                'ON CONFLICT(feed) DO UPDATE SET head = excluded.head, total = excluded.total, '
+                'synced_at = excluded.synced_at',
+                (feed, json.dumps(head), total, time.time())
+            )
+        conn.executemany('INSERT OR IGNORE INTO mirror_media (feed, media_id) VALUES (?, ?)',
+                         [(feed, media_id) for media_id in media_ids])
+
+
+def show_jobs(include_done=False):
+    """Tabela de jobs ativos e com falhas."""
+    jobs = list_jobs(include_done)
+    
+    if not jobs:
+        console.print("  ⭕ [#6272a4]Nenhum job pendente[/]")
+        return
+    
+    table = Table(show_header=True, header_style="#bd93f9", border_style="#6272a4")
+    table.add_column("ID", style="#8be9fd", justify="right")
+    table.add_column("Job", style="#f8f8f2")
+    table.add_column("Status")
+    table.add_column("Feitos", justify="right", style="#50fa7b")
+    table.add_column("Falhas", justify="right", style="#ff5555")
+    table.add_column("Criado", style="#6272a4")
+    
+    for job in jobs:
+        table.add_row(
+            str(job['id']),
+            job['description'],
+            STATUS_LABELS.get(job['status'], job['status']),
+            f"{job['counts'][DONE]}/{job['total']}",
+            str(job['counts'][FAILED]) if job['counts'][FAILED] else "-",
+            time.strftime('%d/%m %H:%M', time.localtime(job['created_at'])),
+        )
+    
+    console.print(table)
+    console.print("  💡 [#6272a4]Retomar: cli-tools resume [ID][/]")
@@ -0,0 +1,150 @@
+"""JSON Stream - Leitura de JSON em eventos, sem montar o documento na memória.
+
+Os eventos seguem o ``ijson.basic_parse``: ``(evento, valor)`` com
+``start_map``, ``map_key``, ``end_map``, ``start_array``, ``end_array``,
+``string``, ``number``, ``boolean`` e ``null``. Com o ijson instalado
+(backend em C) ele é usado; sem ele, um tokenizador em Python puro que
+processa o stream bloco a bloco.
+
+``keep`` restringe as chaves de objeto que interessam: o valor de qualquer
+outra chave é descartado sem gerar eventos. No tokenizador em Python isso
+evita a maior parte do trabalho (o valor é pulado pelo decoder em C do
+``json``); com o ijson os eventos extras chegam e devem ser ignorados.
+"""
+
+import codecs
+import json
+import re
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+CHUNK_SIZE = 256 * 1024
+
+# Um token por match; strings longas e números são consumidos pelo regex (em C).
+# ',' e ':' contam como separadores: chave/valor sai da alternância dentro do
+# objeto (a API manda JSON válido; o tokenizador não valida toda a sintaxe)
+TOKEN = re.compile(r'''
+    [ \t\r\n,:]*
+    (?:
+        (?P<punct>[{}\[\]])
+      | (?P<string>"[^"\\]*(?:\\.[^"\\]*)*")
+      | (?P<number>-?(?:0|[1-9]\d*)(?:\.\d+)?(?:[eE][+-]?\d+)?)
+      | (?P<literal>true|false|null)
+    )
+''', re.VERBOSE)
+
+SEPARATORS = re.compile(r'[ \t\r\n:]*')
+
+DELIMITERS = frozenset(',:]} \t\r\n')
+
+LITERALS = {'true': ('boolean', True), 'false': ('boolean', False), 'null': ('null', None)}
+
+
+def parse_response(response, keep=None):
+    """Eventos do corpo de uma resposta ``requests`` aberta com ``stream=True``."""
+    if ijson is not None:
+        # Descomprimir gzip/br no caminho, como o iter_content faz
+        response.raw.decode_content = True
+        return ijson.basic_parse(response.raw, buf_size=CHUNK_SIZE, use_float=True)
+    return basic_parse(response.iter_content(CHUNK_SIZE), keep)
+
+
+def basic_parse(chunks, keep=None):
+    """Tokenizador incremental: consome blocos de bytes e gera eventos.
+    
+    Só o trecho ainda não tokenizado fica em memória (no máximo um token
+    incompleto mais um bloco).
+    """
+    decoder = codecs.getincrementaldecoder('utf-8')()
+    scan = json.JSONDecoder().raw_decode
+    containers = []
+    expect_key = False
+    # Profundidade dentro de um valor sendo pulado token a token (None: fora)
+    skipping = None
+    buffer = ''
+    
+    def flush(final):
+        nonlocal buffer, expect_key, skipping
+        position = 0
+        end = len(buffer)
+        events = []
+        
+        while True:
+            match = TOKEN.match(buffer, position)
+            if match is None:
+                # String cortada no fim do bloco: esperar o próximo
+                break
+            kind = match.lastgroup
+            if not final and kind in ('number', 'literal') and (
+                    match.end() == end or buffer[match.end()] not in DELIMITERS):
+                # Número/literal pode continuar no próximo bloco ("12" + "34", "1" + ".5")
+                break
+            position = match.end()
+            token = match.group(kind)
+            
+            if skipping is not None:
+                if kind == 'punct':
+                    skipping += 1 if token in '{[' else -1
+                if skipping == 0:
+                    skipping = None
+                    expect_key = True
+                continue
+            
+            if kind == 'string':
+                value = token[1:-1] if '\\' not in token else json.loads(token)
+                if expect_key:
+                    if keep is None or value in keep:
+                        expect_key = False
+                        events.append(('map_key', value))
+                        continue
+                    # Chave fora de ``keep``: pular o valor sem gerar eventos
+                    start = SEPARATORS.match(buffer, position).end()
+                    try:
+                        # Valor inteiro já no buffer: o decoder em C pula de uma vez
+                        _, value_end = scan(buffer, start)
+                    except ValueError:
+                        value_end = None
+                    if value_end is not None and (final or (value_end < end and buffer[value_end] in DELIMITERS)):
+                        position = value_end
+                    else:
+                        # Valor atravessa o fim do bloco: pular token a token
+                        skipping = 0
+                    continue
+                events.append(('string', value))
+            elif kind == 'punct':
+                if token == '{':
+                    containers.append('{')
+                    expect_key = True
+                    events.append(('start_map', None))
+                    continue
+                if token == '[':
+                    containers.append('[')
+                    events.append(('start_array', None))
+                    continue
+                containers.pop()
+                events.append(('end_map' if token == '}' else 'end_array', None))
+            elif kind == 'number':
+                events.append(('number', int(token) if token.lstrip('-').isdigit() else float(token)))
+            else:
+                events.append(LITERALS[token])
+            
+            # Fim de um valor: dentro de objeto, o próximo token é chave
+            expect_key = bool(containers) and containers[-1] == '{'
+        
+        buffer = buffer[position:]
+        if final and buffer.strip():
+            raise ValueError(f"JSON inválido perto de: {buffer[:40]!r}")
+        return events
+    
+    for chunk in chunks:
+        buffer += decoder.decode(chunk)
+        yield from flush(False)
+    
+    buffer += decoder.decode(b'', final=True)
+    yield from flush(True)
+    
+    if containers or skipping is not None:
+        raise ValueError("JSON incompleto: o stream terminou no meio do documento")
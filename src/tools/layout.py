@@ -0,0 +1,59 @@
+"""Layout - Onde e com que nome os downloads são gravados.
+
+Os nomes são determinísticos (id do Pexels, node id do Figma), então
+execuções diferentes não se sobrescrevem. Em ``hash`` e ``date`` os
+arquivos são espalhados em subpastas para que nenhuma pasta acumule
+dezenas de milhares de entradas.
+"""
+
+import hashlib
+import json
+import threading
+import time
+from pathlib import Path
+
+LAYOUTS = ('flat', 'hash', 'date')
+
+# Manifesto NDJSON (uma linha por arquivo gravado) na raiz de cada pasta de saída
+MANIFEST_NAME = 'manifest.ndjson'
+
+_manifest_lock = threading.Lock()
+
+
+def output_dir(folder, out=None):
+    """Pasta de saída de uma ferramenta (``folder``) sob a raiz ``--out``."""
+    return (Path(out or '.') / folder).resolve()
+
+
+def file_path(name, layout='flat', when=None):
+    """Caminho relativo de ``name`` segundo o layout.
+    
+    - ``flat``: ``name``
+    - ``hash``: ``ab/cd/name`` (dois níveis de 256 pastas, pelo sha1 do nome)
+    - ``date``: ``AAAA/MM/DD/name`` (data do planejamento do download)
+    """
+    if layout == 'flat':
+        return name
+    if layout == 'hash':
+        digest = hashlib.sha1(name.encode()).hexdigest()
+        return f"{digest[:2]}/{digest[2:4]}/{name}"
+    if layout == 'date':
+        return time.strftime('%Y/%m/%d/', time.localtime(when)) + name
+    raise ValueError(f"Layout desconhecido: {layout} (use {', '.join(LAYOUTS)})")
+
+
+def safe_id(value):
+    """Id da API em forma segura para nome de arquivo (``1:23`` → ``1-23``)."""
+    return ''.join(c if c.isalnum() or c in '-_.' else '-' for c in str(value))
+
+
+def append_manifest(directory, entry):
+    """Acrescenta uma linha ao manifesto logo após o arquivo ser gravado.
+    
+    Cada linha é escrita e descarregada de uma vez, então leitores podem
+    acompanhar o arquivo (``tail -f``) enquanto o download continua.
+    """
+    line = json.dumps({**entry, 'written_at': round(time.time(), 3)}, ensure_ascii=False) + '\n'
+    with _manifest_lock:
+        with open(Path(directory) / MANIFEST_NAME, 'a', encoding='utf-8') as f:
+            f.write(line)
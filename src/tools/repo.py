@@ -1,12 +1,17 @@
 """Repo - Ferramenta de clonagem e busca em repositórios."""
 
 import os
-import subprocess
+import tarfile
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from itertools import repeat
 import requests
 from pathlib import Path
 from rich.console import Console
 from rich.panel import Panel
 from rich.progress import Progress
+from rich.table import Table
+
+from . import client, tracing
 
 # Carregar variáveis do .env
 try:
@@ -18,6 +23,30 @@ except ImportError:
 console = Console()
 
 GITHUB_TOKEN = os.getenv('GITHUB_TOKEN', '')
+GITHUB_API_URL = 'https://api.github.com'
+GITHUB_BASE_URL = 'https://github.com'
+
+# Repositórios por query GraphQL (cada alias custa pouco do limite de pontos)
+GRAPHQL_BATCH_SIZE = 50
+REST_WORKERS = 8
+
+# Busca no histórico: commits por shard (mínimo) e shards por processo
+HISTORY_MIN_SHARD = 100
+HISTORY_SHARDS_PER_WORKER = 4
+
+GRAPHQL_REPO_FIELDS = """
+    databaseId name nameWithOwner description url homepageUrl sshUrl
+    isPrivate isFork isArchived diskUsage createdAt updatedAt pushedAt
+    stargazerCount forkCount
+    owner { login }
+    watchers { totalCount }
+    issues(states: OPEN) { totalCount }
+    pullRequests(states: OPEN) { totalCount }
+    primaryLanguage { name }
+    defaultBranchRef { name }
+    licenseInfo { key name spdxId }
+    repositoryTopics(first: 20) { nodes { topic { name } } }
+"""
 
 
 def run_repo_cli():
@@ -127,22 +156,28 @@ def search_github(query, language=None, sort="stars", limit=10):
     if language:
         params['q'] += f' language:{language}'
     
-    response = requests.get('https://api.github.com/search/repositories', 
+    response = client.get(f'{GITHUB_API_URL}/search/repositories', 
                           headers=headers, params=params)
     response.raise_for_status()
     
     return response.json()
 
 
-def clone_repository(repo, query=None, depth=None):
+def clone_repository(repo, query=None, depth=None, history=False):
     """Clona repositório do GitHub."""
     if '/' not in repo:
         raise ValueError("Formato deve ser: usuario/repositorio")
     
     # URL do repositório
-    repo_url = f"https://github.com/{repo}.git"
+    repo_url = f"{GITHUB_BASE_URL}/{repo}.git"
     repo_name = repo.split('/')[-1]
     
+    # Busca no histórico reaproveita um clone existente
+    if history and query and (Path(repo_name) / '.git').exists():
+        console.print(f"  📁 [#6272a4]Usando clone existente: {repo_name}[/]")
+        show_history_results(repo_name, query)
+        return f"Histórico de {repo} pesquisado"
+    
     # Verificar se já existe
     if Path(repo_name).exists():
         raise Exception(f"Diretório '{repo_name}' já existe")
@@ -158,7 +193,7 @@ def clone_repository(repo, query=None, depth=None):
     console.print("  📥 [#6272a4]Executando git clone...[/]")
     
     # Executar clone
-    result = subprocess.run(cmd, capture_output=True, text=True)
+    result = tracing.run(cmd, capture_output=True, text=True)
     
     if result.returncode != 0:
         if "not found" in result.stderr.lower():
@@ -170,8 +205,12 @@ def clone_repository(repo, query=None, depth=None):
     
     console.print(f"  📁 [#50fa7b]Repositório clonado: {repo_name}[/]")
     
+    # Buscar no histórico se especificado
+    if query and history:
+        show_history_results(repo_name, query)
+    
     # Buscar nos arquivos se especificado
-    if query:
+    elif query:
         console.print("  🔍 [#6272a4]Buscando nos arquivos...[/]")
         search_results = search_in_files(repo_name, query)
         
@@ -203,7 +242,7 @@ def search_in_files(directory, pattern, file_types=None):
             cmd.extend(['--include', f'*.{ext}'])
     
     try:
-        result = subprocess.run(cmd, capture_output=True, text=True)
+        result = tracing.run(cmd, capture_output=True, text=True)
         
         for line in result.stdout.split('\n'):
             if ':' in line and line.strip():
@@ -220,18 +259,344 @@ def search_in_files(directory, pattern, file_types=None):
     return results
 
 
+def show_history_results(directory, query):
+    """Mostra os commits que adicionaram ou removeram o padrão."""
+    console.print("  🕓 [#6272a4]Buscando no histórico de commits...[/]")
+    
+    total = 0
+    for commit in search_history(directory, query):
+        total += 1
+        files = ', '.join(commit['files'][:3])
+        if len(commit['files']) > 3:
+            files += f" (+{len(commit['files']) - 3})"
+        console.print(
+            f"    🔖 [#bd93f9]{commit['short']}[/] [#6272a4]{commit['date']} {commit['author']}[/] "
+            f"{commit['subject'][:60]} [#8be9fd]{files}[/]"
+        )
+    
+    if total:
+        console.print(f"  📋 [#50fa7b]{total} commits alteram '{query}'[/]")
+    else:
+        console.print(f"  ⚠️  [#f1fa8c]Nenhum commit alterou '{query}'[/]")
+    
+    return total
+
+
+def search_history(directory, pattern, rev_range='HEAD', regex=False, workers=None):
+    """Gera os commits que adicionam ou removem ``pattern``, em ordem de commit.
+    
+    A lista de commits de ``rev_range`` é dividida em shards e cada shard
+    roda ``git log -S`` (ou ``-G`` com ``regex=True``) num pool de
+    processos. Os resultados saem na ordem do ``git rev-list``, conforme
+    cada shard termina. Clones rasos são aprofundados antes da busca.
+    """
+    deepen_shallow_clone(directory)
+    
+    result = tracing.run(['git', '-C', str(directory), 'rev-list', rev_range],
+                         capture_output=True, text=True)
+    if result.returncode != 0:
+        raise Exception(f"Erro no git: {result.stderr.strip()}")
+    
+    commits = result.stdout.split()
+    if not commits:
+        return
+    
+    workers = workers or os.cpu_count() or 1
+    shard_size = max(HISTORY_MIN_SHARD, -(-len(commits) // (workers * HISTORY_SHARDS_PER_WORKER)))
+    shards = [commits[i:i + shard_size] for i in range(0, len(commits), shard_size)]
+    
+    if len(shards) == 1:
+        yield from _search_history_shard(directory, shards[0], pattern, regex)[0]
+        return
+    
+    with ProcessPoolExecutor(max_workers=min(workers, len(shards))) as executor:
+        for shard_results, spans in executor.map(_search_history_shard, repeat(str(directory)),
+                                                 shards, repeat(pattern), repeat(regex),
+                                                 repeat(tracing.is_enabled())):
+            tracing.extend(spans)
+            yield from shard_results
+
+
+def _search_history_shard(directory, commits, pattern, regex=False, traced=False):
+    """Roda o pickaxe do git sobre uma lista explícita de commits.
+    
+    Retorna ``(resultados, spans)``; com ``traced`` os spans registrados no
+    processo filho voltam para o pai.
+    """
+    if traced:
+        tracing.start_capture()
+    
+    cmd = ['git', '-C', str(directory), 'log', '-i', '--no-walk=unsorted', '--stdin',
+           '--name-only', '--date=short', '--format=%x1e%H%x1f%h%x1f%an%x1f%ad%x1f%s']
+    cmd.append(f'-G{pattern}' if regex else f'-S{pattern}')
+    
+    result = tracing.run(cmd, input='\n'.join(commits), capture_output=True, text=True)
+    if result.returncode != 0:
+        raise Exception(f"Erro no git: {result.stderr.strip()}")
+    
+    results = []
+    for record in result.stdout.split('\x1e')[1:]:
+        header, _, files = record.partition('\n')
+        sha, short, author, date, subject = header.split('\x1f', 4)
+        results.append({
+            'commit': sha,
+            'short': short,
+            'author': author,
+            'date': date,
+            'subject': subject,
+            'files': [f for f in files.split('\n') if f.strip()]
+        })
+    return results, tracing.drain() if traced else []
+
+
+def deepen_shallow_clone(directory):
+    """Converte um clone raso (--depth) em clone completo, se necessário."""
+    result = tracing.run(['git', '-C', str(directory), 'rev-parse', '--is-shallow-repository'],
+                         capture_output=True, text=True)
+    if result.stdout.strip() != 'true':
+        return False
+    
+    console.print("  📥 [#6272a4]Clone raso: baixando o histórico completo...[/]")
+    result = tracing.run(['git', '-C', str(directory), 'fetch', '--unshallow'],
+                         capture_output=True, text=True)
+    if result.returncode != 0:
+        raise Exception(f"Erro no git: {result.stderr.strip()}")
+    return True
+
+
+def search_repository_archive(repo, query, ref=None):
+    """Busca nos arquivos do repositório sem clonar, via tarball em streaming."""
+    if '/' not in repo:
+        raise ValueError("Formato deve ser: usuario/repositorio")
+    
+    console.print("  📥 [#6272a4]Lendo tarball do repositório em streaming...[/]")
+    
+    total = 0
+    for result in iter_archive_matches(repo, query, ref):
+        total += 1
+        if total <= 10:
+            console.print(f"    📄 [#8be9fd]{result['file']}[/][#6272a4]:{result['line_number']}[/] {result['line'][:60]}...")
+    
+    if total:
+        if total > 10:
+            console.print(f"    [#6272a4]... e mais {total - 10} resultados[/]")
+        console.print(f"  📋 [#50fa7b]Encontrados {total} resultados para '{query}'[/]")
+    else:
+        console.print(f"  ⚠️  [#f1fa8c]Nenhum resultado encontrado para '{query}'[/]")
+    
+    return total
+
+
+def iter_archive_matches(repo, pattern, ref=None):
+    """Gera resultados de busca lendo o tarball do GitHub em memória.
+    
+    Os arquivos são descompactados conforme chegam pela rede e nada é
+    gravado em disco. Os resultados têm o mesmo formato de
+    ``search_in_files`` (busca case insensitive, binários ignorados).
+    """
+    headers = {}
+    if GITHUB_TOKEN:
+        headers['Authorization'] = f'token {GITHUB_TOKEN}'
+    
+    url = f'{GITHUB_API_URL}/repos/{repo}/tarball'
+    if ref:
+        url += f'/{ref}'
+    
+    needle = pattern.lower()
+    
+    with client.get(url, headers=headers, stream=True) as response:
+        if response.status_code == 404:
+            raise Exception(f"Repositório '{repo}' não encontrado")
+        response.raise_for_status()
+        response.raw.decode_content = True
+        
+        with tarfile.open(fileobj=response.raw, mode='r|gz') as archive:
+            for member in archive:
+                if not member.isfile():
+                    continue
+                
+                content = archive.extractfile(member).read()
+                if b'\0' in content[:8192]:
+                    continue
+                
+                # Remover a pasta raiz "usuario-repo-sha/" do tarball
+                file_path = member.name.split('/', 1)[-1]
+                text = content.decode('utf-8', errors='replace')
+                if needle not in text.lower():
+                    continue
+                
+                for line_number, line in enumerate(text.splitlines(), 1):
+                    if needle in line.lower():
+                        yield {
+                            'file': file_path,
+                            'line_number': str(line_number),
+                            'line': line.strip()
+                        }
+
+
 def get_repo_info(repo):
     """Obtém informações do repositório."""
     headers = {}
     if GITHUB_TOKEN:
         headers['Authorization'] = f'token {GITHUB_TOKEN}'
     
-    response = requests.get(f'https://api.github.com/repos/{repo}', headers=headers)
+    response = client.get(f'{GITHUB_API_URL}/repos/{repo}', headers=headers)
     response.raise_for_status()
     
     return response.json()
 
 
+def get_repos_info(repos, batch_size=GRAPHQL_BATCH_SIZE):
+    """Obtém informações de vários repositórios de uma vez.
+    
+    Com token usa queries GraphQL com aliases (``batch_size`` repositórios
+    por request); sem token faz as chamadas REST em paralelo. Retorna um
+    dict ``{repo: info}`` na ordem de entrada, com ``None`` para
+    repositórios não encontrados.
+    """
+    repos = list(dict.fromkeys(r.strip() for r in repos if r.strip()))
+    for repo in repos:
+        parts = repo.split('/')
+        if len(parts) != 2 or not parts[0] or not parts[1]:
+            raise ValueError(f"Formato inválido '{repo}': use usuario/repositorio")
+    
+    if not GITHUB_TOKEN:
+        return _get_repos_info_rest(repos)
+    
+    results = {}
+    for start in range(0, len(repos), batch_size):
+        results.update(_get_repos_info_graphql(repos[start:start + batch_size]))
+    return results
+
+
+def _get_repos_info_graphql(repos):
+    """Busca um lote de repositórios numa única query GraphQL."""
+    declarations = []
+    selections = []
+    variables = {}
+    
+    for i, repo in enumerate(repos):
+        owner, name = repo.split('/')
+        declarations.append(f'$o{i}: String!, $n{i}: String!')
+        selections.append(f'r{i}: repository(owner: $o{i}, name: $n{i}) {{ ...repo }}')
+        variables[f'o{i}'] = owner
+        variables[f'n{i}'] = name
+    
+    query = (
+        f"query({', '.join(declarations)}) {{\n  "
+        + '\n  '.join(selections)
+        + f"\n}}\nfragment repo on Repository {{{GRAPHQL_REPO_FIELDS}}}"
+    )
+    
+    headers = {'Authorization': f'bearer {GITHUB_TOKEN}'}
+    response = client.post(f'{GITHUB_API_URL}/graphql', headers=headers,
+                           json={'query': query, 'variables': variables})
+    response.raise_for_status()
+    
+    payload = response.json()
+    data = payload.get('data') or {}
+    
+    # Repositórios inexistentes voltam como null com erro NOT_FOUND;
+    # qualquer outro erro invalida o lote inteiro
+    errors = [e for e in payload.get('errors', []) if e.get('type') != 'NOT_FOUND']
+    if errors:
+        raise Exception(f"Erro na API GraphQL: {errors[0].get('message')}")
+    
+    return {
+        repo: _graphql_to_rest(data.get(f'r{i}')) if data.get(f'r{i}') else None
+        for i, repo in enumerate(repos)
+    }
+
+
+def _graphql_to_rest(node):
+    """Converte um Repository GraphQL para o formato da API REST."""
+    license_info = node.get('licenseInfo')
+    language = node.get('primaryLanguage')
+    branch = node.get('defaultBranchRef')
+    
+    return {
+        'id': node['databaseId'],
+        'name': node['name'],
+        'full_name': node['nameWithOwner'],
+        'owner': {'login': node['owner']['login']},
+        'private': node['isPrivate'],
+        'fork': node['isFork'],
+        'archived': node['isArchived'],
+        'description': node.get('description'),
+        'html_url': node['url'],
+        'homepage': node.get('homepageUrl'),
+        'clone_url': f"{node['url']}.git",
+        'ssh_url': node.get('sshUrl'),
+        'size': node.get('diskUsage') or 0,
+        'stargazers_count': node['stargazerCount'],
+        'watchers_count': node['stargazerCount'],
+        'subscribers_count': node['watchers']['totalCount'],
+        'forks_count': node['forkCount'],
+        'open_issues_count': node['issues']['totalCount'] + node['pullRequests']['totalCount'],
+        'language': language['name'] if language else None,
+        'default_branch': branch['name'] if branch else None,
+        'license': {
+            'key': license_info['key'],
+            'name': license_info['name'],
+            'spdx_id': license_info['spdxId'],
+        } if license_info else None,
+        'topics': [t['topic']['name'] for t in node['repositoryTopics']['nodes']],
+        'created_at': node['createdAt'],
+        'updated_at': node['updatedAt'],
+        'pushed_at': node['pushedAt'],
+    }
+
+
+def _get_repos_info_rest(repos):
+    """Busca repositórios via REST em paralelo (sem token)."""
+    def fetch(repo):
+        try:
+            return get_repo_info(repo)
+        except requests.HTTPError as e:
+            if e.response is not None and e.response.status_code == 404:
+                return None
+            raise
+    
+    with ThreadPoolExecutor(max_workers=REST_WORKERS) as executor:
+        futures = [tracing.submit(executor, fetch, repo) for repo in repos]
+        return {repo: future.result() for repo, future in zip(repos, futures)}
+
+
+def show_repos_info(repos):
+    """Mostra tabela com informações de vários repositórios."""
+    if not repos:
+        raise ValueError("Nenhum repositório informado")
+    
+    mode = "GraphQL" if GITHUB_TOKEN else "REST"
+    console.print(f"  🔍 [#6272a4]Buscando {len(repos)} repositórios via {mode}...[/]")
+    
+    results = get_repos_info(repos)
+    
+    table = Table(show_header=True, header_style="#bd93f9", border_style="#6272a4")
+    table.add_column("Repositório", style="#8be9fd")
+    table.add_column("⭐", justify="right", style="#f1fa8c")
+    table.add_column("Forks", justify="right", style="#bd93f9")
+    table.add_column("Linguagem", style="#50fa7b")
+    table.add_column("Atualizado", style="#6272a4")
+    table.add_column("Descrição", style="#f8f8f2", max_width=50)
+    
+    for repo, info in results.items():
+        if info is None:
+            table.add_row(repo, "", "", "", "", "[#ff5555]❌ Não encontrado[/]")
+            continue
+        table.add_row(
+            info['full_name'],
+            str(info['stargazers_count']),
+            str(info['forks_count']),
+            info.get('language') or '-',
+            (info.get('pushed_at') or '')[:10],
+            info.get('description') or ''
+        )
+    
+    console.print(table)
+    return results
+
+
 # Manter compatibilidade
 def run_repo_ui():
     """Alias para compatibilidade."""
@@ -1,20 +1,194 @@
 """Status - Verificação de APIs e sistema."""
 
 import os
+import hashlib
+import json
+import math
 import shutil
-import subprocess
 import platform
+import sys
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed, wait
+from concurrent.futures import TimeoutError as FuturesTimeout
+from importlib import metadata
 from pathlib import Path
 from rich.console import Console
+from rich.live import Live
 from rich.table import Table
 from rich.panel import Panel
 import requests
 
+from . import client, jobs, tracing
+
 console = Console()
 
 
-def show_status_cli():
-    """Interface CLI para status com tema Dracula."""
+# Tempo máximo (segundos) para todas as verificações de rede juntas
+PROBE_DEADLINE = 5
+
+API_CHECKS = [
+    {
+        'name': 'Pexels',
+        'env': 'PEXELS_API_KEY',
+        'url': 'https://api.pexels.com/v1/search?query=test&per_page=1',
+        'headers': lambda token: {'Authorization': token},
+        'free_tier': '200 requests/hora',
+        'quota_per_hour': 200,
+        'unconfigured': "[#6272a4]⭕ Não configurado[/]",
+        'invalid': "[#ff5555]❌ Chave inválida[/]",
+    },
+    {
+        'name': 'Figma',
+        'env': 'FIGMA_TOKEN',
+        'url': 'https://api.figma.com/v1/me',
+        'headers': lambda token: {'X-Figma-Token': token},
+        'free_tier': '30 requests/minuto',
+        'quota_per_hour': 1800,
+        'unconfigured': "[#6272a4]⭕ Não configurado[/]",
+        'invalid': "[#ff5555]❌ Token inválido[/]",
+    },
+    {
+        'name': 'GitHub',
+        'env': 'GITHUB_TOKEN',
+        'url': 'https://api.github.com/user',
+        'headers': lambda token: {'Authorization': f'token {token}'},
+        'free_tier': '5000 requests/hora',
+        'quota_per_hour': 5000,
+        'unconfigured': "[#6272a4]💡 Opcional[/]",
+        'invalid': "[#ff5555]❌ Token inválido[/]",
+    },
+]
+
+DEPENDENCIES = ['textual', 'requests', 'click', 'rich', 'python-dotenv']
+
+OUTPUT_FOLDERS = [
+    ('imagens', 'Image'),
+    ('videos', 'Image'),
+    ('figma', 'FigClone'),
+    ('repos', 'Repo')
+]
+
+STATUS_SECTIONS = ('apis', 'system', 'folders')
+
+# Versão do formato de `status --json`; mudar apenas com quebra de schema
+STATUS_SCHEMA_VERSION = 1
+
+# Amostras mantidas por API no modo --watch
+WATCH_WINDOW = 360
+
+# Segundos em que o resultado de uma verificação de API vale no `status --json`
+PROBE_CACHE_TTL = 600
+
+# Fração da quota por hora de cada API que o --watch pode gastar
+WATCH_QUOTA_SHARE = 0.25
+
+
+def sample_api(check, timeout=PROBE_DEADLINE):
+    """Mede uma verificação da API (sem retries: o prazo é do próprio status)."""
+    token = os.getenv(check['env'], '')
+    start = time.perf_counter()
+    sample = {'ts': round(time.time(), 3), 'api': check['name'], 'status': None,
+              'ok': False, 'latency_ms': None, 'remaining': None, 'error': None}
+    try:
+        response = client.get(check['url'], retry=False, headers=check['headers'](token), timeout=timeout)
+        # Ler o corpo: mede a resposta completa e devolve a conexão ao pool
+        response.content
+        sample['status'] = response.status_code
+        sample['ok'] = response.status_code == 200
+        remaining = response.headers.get('X-RateLimit-Remaining')
+        if remaining and remaining.isdigit():
+            sample['remaining'] = int(remaining)
+    except requests.RequestException as e:
+        sample['error'] = type(e).__name__
+    sample['latency_ms'] = round((time.perf_counter() - start) * 1000, 1)
+    return sample
+
+
+def get_git_version():
+    """Versão do git instalado, ou None."""
+    if not shutil.which('git'):
+        return None
+    try:
+        result = tracing.run(['git', '--version'], capture_output=True, text=True)
+    except OSError:
+        return None
+    return result.stdout.strip().split()[-1] if result.returncode == 0 else None
+
+
+def get_dependency_versions(deps=DEPENDENCIES):
+    """Versões instaladas via metadados, sem importar os pacotes."""
+    versions = {}
+    for dep in deps:
+        try:
+            versions[dep] = metadata.version(dep)
+        except metadata.PackageNotFoundError:
+            versions[dep] = None
+    return versions
+
+
+def start_probes(executor, checks=API_CHECKS):
+    """Dispara as verificações das APIs configuradas em paralelo."""
+    return {
+        tracing.submit(executor, sample_api, check): check
+        for check in checks
+        if os.getenv(check['env'], '')
+    }
+
+
+def _format_probe(check, sample):
+    """Texto de status para uma verificação concluída."""
+    if sample['status'] is None:
+        return "[#f1fa8c]⚠️ Sem conexão[/]"
+    if sample['ok']:
+        return "[#50fa7b]✅ Funcionando[/]"
+    return check['invalid']
+
+
+def folder_stats(path):
+    """Conta arquivos e bytes de uma pasta com os.scandir, sem montar listas."""
+    files = 0
+    size = 0
+    pending = [path]
+    
+    while pending:
+        try:
+            with os.scandir(pending.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        pending.append(entry.path)
+                    elif entry.is_file(follow_symlinks=False):
+                        files += 1
+                        size += entry.stat(follow_symlinks=False).st_size
+        except OSError:
+            continue
+    
+    return {'files': files, 'bytes': size}
+
+
+def _build_api_table(statuses):
+    api_table = Table(show_header=True, header_style="#bd93f9", border_style="#6272a4")
+    api_table.add_column("API", style="#8be9fd", width=12)
+    api_table.add_column("Status", width=15)
+    api_table.add_column("Free Tier", style="#6272a4", width=20)
+    
+    for check in API_CHECKS:
+        api_table.add_row(check['name'], statuses[check['name']], check['free_tier'])
+    
+    return api_table
+
+
+def show_status_cli(only=None):
+    """Interface CLI para status com tema Dracula.
+    
+    ``only`` limita a saída a uma seção: ``apis``, ``system`` ou ``folders``.
+    """
+    
+    # Disparar todas as verificações lentas antes de desenhar qualquer coisa
+    executor = ThreadPoolExecutor(max_workers=len(API_CHECKS) + 1)
+    deadline = time.monotonic() + PROBE_DEADLINE
+    probes = start_probes(executor) if only in (None, 'apis') else {}
+    git_future = tracing.submit(executor, get_git_version) if only in (None, 'system') else None
     
     # Header com tema Dracula
     console.print()
@@ -23,72 +197,51 @@ def show_status_cli():
     console.print("Verificação de APIs e informações do sistema", style="#f8f8f2")
     console.print()
     
-    # Status das APIs
-    console.print("🔑 [#f1fa8c]STATUS DAS APIs[/]", style="#f8f8f2")
-    console.print()
+    if only in (None, 'apis'):
+        _show_apis(probes, deadline)
     
-    api_table = Table(show_header=True, header_style="#bd93f9", border_style="#6272a4")
-    api_table.add_column("API", style="#8be9fd", width=12)
-    api_table.add_column("Status", width=15)
-    api_table.add_column("Free Tier", style="#6272a4", width=20)
+    executor.shutdown(wait=False)
     
-    # Pexels
-    pexels_key = os.getenv('PEXELS_API_KEY', '')
-    if pexels_key:
-        try:
-            headers = {'Authorization': pexels_key}
-            response = requests.get('https://api.pexels.com/v1/search?query=test&per_page=1', 
-                                  headers=headers, timeout=5)
-            if response.status_code == 200:
-                pexels_status = "[#50fa7b]✅ Funcionando[/]"
-            else:
-                pexels_status = "[#ff5555]❌ Chave inválida[/]"
-        except:
-            pexels_status = "[#f1fa8c]⚠️ Sem conexão[/]"
-    else:
-        pexels_status = "[#6272a4]⭕ Não configurado[/]"
+    if only in (None, 'system'):
+        _show_system(git_future, deadline)
     
-    api_table.add_row("Pexels", pexels_status, "200 requests/hora")
+    if only in (None, 'folders'):
+        _show_folders()
     
-    # Figma
-    figma_token = os.getenv('FIGMA_TOKEN', '')
-    if figma_token:
-        try:
-            headers = {'X-Figma-Token': figma_token}
-            response = requests.get('https://api.figma.com/v1/me', 
-                                  headers=headers, timeout=5)
-            if response.status_code == 200:
-                figma_status = "[#50fa7b]✅ Funcionando[/]"
-            else:
-                figma_status = "[#ff5555]❌ Token inválido[/]"
-        except:
-            figma_status = "[#f1fa8c]⚠️ Sem conexão[/]"
-    else:
-        figma_status = "[#6272a4]⭕ Não configurado[/]"
+    if only in (None, 'system'):
+        _show_dependencies()
+    
+    if only is None:
+        _show_summary()
+
+
+def _show_apis(probes, deadline):
+    # Status das APIs
+    console.print("🔑 [#f1fa8c]STATUS DAS APIs[/]", style="#f8f8f2")
+    console.print()
     
-    api_table.add_row("Figma", figma_status, "30 requests/minuto")
+    statuses = {
+        check['name']: "[#6272a4]⏳ Testando...[/]" if os.getenv(check['env'], '') else check['unconfigured']
+        for check in API_CHECKS
+    }
     
-    # GitHub
-    github_token = os.getenv('GITHUB_TOKEN', '')
-    if github_token:
+    # Preencher a tabela conforme cada verificação termina
+    with Live(_build_api_table(statuses), console=console, auto_refresh=False) as live:
         try:
-            headers = {'Authorization': f'token {github_token}'}
-            response = requests.get('https://api.github.com/user', 
-                                  headers=headers, timeout=5)
-            if response.status_code == 200:
-                github_status = "[#50fa7b]✅ Funcionando[/]"
-            else:
-                github_status = "[#ff5555]❌ Token inválido[/]"
-        except:
-            github_status = "[#f1fa8c]⚠️ Sem conexão[/]"
-    else:
-        github_status = "[#6272a4]💡 Opcional[/]"
-    
-    api_table.add_row("GitHub", github_status, "5000 requests/hora")
+            for future in as_completed(probes, timeout=max(0, deadline - time.monotonic())):
+                check = probes[future]
+                statuses[check['name']] = _format_probe(check, future.result())
+                live.update(_build_api_table(statuses), refresh=True)
+        except FuturesTimeout:
+            for future, check in probes.items():
+                if not future.done():
+                    statuses[check['name']] = "[#f1fa8c]⏱️ Timeout[/]"
+            live.update(_build_api_table(statuses), refresh=True)
     
-    console.print(api_table)
     console.print()
-    
+
+
+def _show_system(git_future, deadline):
     # Informações do sistema
     console.print("🖥️  [#f1fa8c]INFORMAÇÕES DO SISTEMA[/]", style="#f8f8f2")
     console.print()
@@ -104,11 +257,10 @@ def show_status_cli():
     
     # Git
     try:
-        result = subprocess.run(['git', '--version'], capture_output=True, text=True)
-        git_version = result.stdout.strip().split()[-1] if result.returncode == 0 else "❌ Não instalado"
-    except:
-        git_version = "❌ Não instalado"
-    system_table.add_row("Git", git_version)
+        git_version = git_future.result(timeout=max(0, deadline - time.monotonic()))
+    except FuturesTimeout:
+        git_version = None
+    system_table.add_row("Git", git_version or "❌ Não instalado")
     
     # Espaço em disco
     try:
@@ -133,7 +285,9 @@ def show_status_cli():
     
     console.print(system_table)
     console.print()
-    
+
+
+def _show_folders():
     # Pastas de saída
     console.print("📁 [#f1fa8c]PASTAS DE SAÍDA[/]", style="#f8f8f2")
     console.print()
@@ -143,19 +297,13 @@ def show_status_cli():
     folders_table.add_column("Status", width=15)
     folders_table.add_column("Arquivos", style="#6272a4")
     
-    folders = [
-        ('imagens', 'Image'),
-        ('figma', 'FigClone'), 
-        ('repos', 'Repo')
-    ]
-    
-    for folder, tool in folders:
+    for folder, tool in OUTPUT_FOLDERS:
         path = Path(folder)
         if path.exists():
-            count = len(list(path.iterdir()))
-            if count > 0:
+            stats = folder_stats(path)
+            if stats['files'] > 0:
                 status = "[#50fa7b]📁 Existe[/]"
-                files = f"{count} arquivos"
+                files = f"{stats['files']} arquivos ({stats['bytes'] // (1024 * 1024)}MB)"
             else:
                 status = "[#f1fa8c]📂 Vazia[/]"
                 files = "0 arquivos"
@@ -167,27 +315,28 @@ def show_status_cli():
     
     console.print(folders_table)
     console.print()
-    
+
+
+def _show_dependencies():
     # Dependências
     console.print("📦 [#f1fa8c]DEPENDÊNCIAS[/]", style="#f8f8f2")
     console.print()
     
     deps_info = []
-    deps = ['textual', 'requests', 'click', 'rich', 'python-dotenv']
     
-    for dep in deps:
-        try:
-            module = __import__(dep.replace('-', '_'))
-            version = getattr(module, '__version__', 'desconhecida')
+    for dep, version in get_dependency_versions().items():
+        if version:
             deps_info.append(f"[#50fa7b]✅[/] {dep} v{version}")
-        except ImportError:
+        else:
             deps_info.append(f"[#ff5555]❌[/] {dep} não instalado")
     
     for dep_info in deps_info:
         console.print(f"  {dep_info}")
     
     console.print()
-    
+
+
+def _show_summary():
     # Resumo
     configured_apis = sum([
         1 if os.getenv('PEXELS_API_KEY') else 0,
@@ -217,18 +366,290 @@ def show_status_cli():
     ))
 
 
-def check_dependencies():
-    """Verifica dependências instaladas."""
-    deps = ['textual', 'requests', 'click', 'rich', 'python-dotenv']
-    missing = []
+def collect_status(only=None, refresh=False):
+    """Coleta o status como dados puros (schema estável, sem renderização).
+    
+    Estrutura: ``{"schema", "generated_at", "apis", "system", "folders"}``;
+    com ``only`` apenas a seção pedida é incluída. ``refresh`` ignora o
+    cache das verificações de API.
+    """
+    data = {'schema': STATUS_SCHEMA_VERSION, 'generated_at': round(time.time(), 3)}
+    
+    if only in (None, 'apis'):
+        data['apis'] = collect_apis(max_age=0 if refresh else PROBE_CACHE_TTL)
+    if only in (None, 'system'):
+        data['system'] = collect_system()
+    if only in (None, 'folders'):
+        data['folders'] = collect_folders()
+    
+    return data
+
+
+def probe_cache_path():
+    """Cache das verificações de API, ao lado do diário de jobs."""
+    return jobs.db_path().parent / 'status-cache.json'
+
+
+def _token_fingerprint(check):
+    # Trocar a chave invalida o cache sem gravar o token em disco
+    return hashlib.sha256(os.getenv(check['env'], '').encode()).hexdigest()[:16]
+
+
+def _load_probe_cache():
+    try:
+        with open(probe_cache_path(), encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_probe_cache(cache):
+    path = probe_cache_path()
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f'{path.name}.{os.getpid()}.tmp')
+        with open(tmp, 'w', encoding='utf-8') as f:
+            json.dump(cache, f)
+        os.replace(tmp, path)
+    except OSError:
+        # Sem cache o status continua funcionando, só volta a consultar as APIs
+        pass
+
+
+def collect_apis(deadline=PROBE_DEADLINE, max_age=PROBE_CACHE_TTL):
+    """Status das APIs: ok, invalid, offline, timeout ou unconfigured.
+    
+    Resultados ``ok``/``invalid`` com menos de ``max_age`` segundos vêm do
+    cache em disco (cada verificação do Pexels é uma busca cobrada na quota);
+    ``max_age=0`` força consultar todas as APIs.
+    """
+    apis = {
+        check['name'].lower(): {'configured': False, 'status': 'unconfigured',
+                                'http_status': None, 'latency_ms': None, 'checked_at': None}
+        for check in API_CHECKS
+    }
+    
+    now = time.time()
+    cache = _load_probe_cache()
+    stale = []
+    for check in API_CHECKS:
+        if not os.getenv(check['env'], ''):
+            continue
+        cached = cache.get(check['name'].lower())
+        if (cached and cached.get('token') == _token_fingerprint(check)
+                and 0 <= now - cached['checked_at'] < max_age):
+            apis[check['name'].lower()].update(
+                {key: value for key, value in cached.items() if key != 'token'}, configured=True)
+        else:
+            stale.append(check)
+    
+    if not stale:
+        return apis
+    
+    executor = ThreadPoolExecutor(max_workers=len(stale))
+    probes = start_probes(executor, stale)
+    done, _ = wait(probes, timeout=deadline)
+    executor.shutdown(wait=False)
+    
+    for future, check in probes.items():
+        entry = apis[check['name'].lower()]
+        entry['configured'] = True
+        if future not in done:
+            entry['status'] = 'timeout'
+            continue
+        sample = future.result()
+        entry['http_status'] = sample['status']
+        entry['latency_ms'] = sample['latency_ms']
+        entry['checked_at'] = sample['ts']
+        if sample['status'] is None:
+            entry['status'] = 'offline'
+        else:
+            entry['status'] = 'ok' if sample['ok'] else 'invalid'
+            cache[check['name'].lower()] = {**entry, 'token': _token_fingerprint(check)}
     
-    for dep in deps:
-        try:
-            __import__(dep.replace('-', '_'))
-        except ImportError:
-            missing.append(dep)
+    _save_probe_cache(cache)
+    return apis
+
+
+def collect_system():
+    """Sistema, git, disco e dependências."""
+    try:
+        disk_usage = shutil.disk_usage('.')
+        disk = {
+            'total_bytes': disk_usage.total,
+            'free_bytes': disk_usage.free,
+            'used_percent': round((disk_usage.total - disk_usage.free) / disk_usage.total * 100, 1)
+        }
+    except OSError:
+        disk = None
+    
+    return {
+        'os': platform.system(),
+        'release': platform.release(),
+        'arch': platform.machine(),
+        'python': platform.python_version(),
+        'git': get_git_version(),
+        'disk': disk,
+        'cwd': str(Path.cwd()),
+        'dependencies': get_dependency_versions()
+    }
+
+
+def collect_folders():
+    """Pastas de saída com contagem de arquivos e bytes."""
+    folders = {}
+    for folder, _ in OUTPUT_FOLDERS:
+        path = Path(folder)
+        if path.is_dir():
+            folders[folder] = {'exists': True, **folder_stats(path)}
+        else:
+            folders[folder] = {'exists': False, 'files': 0, 'bytes': 0}
+    return folders
+
+
+def print_status_json(only=None, refresh=False):
+    """Imprime o status em JSON numa linha, para scripts e monitoramento."""
+    sys.stdout.write(json.dumps(collect_status(only, refresh), ensure_ascii=False) + '\n')
+
+
+class LatencyWindow:
+    """Janela deslizante de latências e erros de uma API."""
+    
+    def __init__(self, size=WATCH_WINDOW):
+        self.samples = deque(maxlen=size)
+        self.last = None
+        self.remaining = None
+    
+    def add(self, sample):
+        self.samples.append((sample['latency_ms'], sample['ok']))
+        self.last = sample
+        if sample['remaining'] is not None:
+            self.remaining = sample['remaining']
+    
+    def percentile(self, p):
+        latencies = sorted(latency for latency, ok in self.samples if ok)
+        if not latencies:
+            return None
+        index = min(len(latencies) - 1, int(round(p / 100 * (len(latencies) - 1))))
+        return latencies[index]
+    
+    def error_rate(self):
+        if not self.samples:
+            return 0.0
+        return sum(1 for _, ok in self.samples if not ok) / len(self.samples)
+
+
+def _format_ms(value):
+    return f"{value:.0f}ms" if value is not None else "-"
+
+
+def watch_cycles(check, interval):
+    """A cada quantos ciclos do --watch a API é amostrada sem estourar a quota.
+    
+    Cada amostra é um request cobrado (o Pexels conta até a busca de teste);
+    o --watch usa no máximo ``WATCH_QUOTA_SHARE`` da quota por hora.
+    """
+    budget = check['quota_per_hour'] * WATCH_QUOTA_SHARE
+    return max(1, math.ceil(3600 / interval / budget))
+
+
+def _build_watch_table(checks, windows, interval, cycles):
+    slower = [f"{check['name']} a cada {cycles[check['name']] * interval:g}s"
+              for check in checks if cycles[check['name']] > 1]
+    caption = f"Intervalo {interval:g}s" + (f" ({', '.join(slower)})" if slower else "") + " · Ctrl+C para sair"
+    table = Table(show_header=True, header_style="#bd93f9", border_style="#6272a4",
+                  caption=caption, caption_style="#6272a4")
+    table.add_column("API", style="#8be9fd", width=10)
+    table.add_column("Último", width=16)
+    table.add_column("p50", justify="right")
+    table.add_column("p95", justify="right")
+    table.add_column("p99", justify="right")
+    table.add_column("Erros", justify="right")
+    table.add_column("Quota", justify="right", style="#bd93f9")
+    table.add_column("Amostras", justify="right", style="#6272a4")
+    
+    for check in checks:
+        window = windows[check['name']]
+        last = window.last
+        if last is None:
+            current = "[#6272a4]⏳ Aguardando[/]"
+        elif last['ok']:
+            current = f"[#50fa7b]✅ {_format_ms(last['latency_ms'])}[/]"
+        else:
+            current = f"[#ff5555]❌ {last['status'] or last['error']}[/]"
+        
+        error_rate = window.error_rate()
+        error_color = "#ff5555" if error_rate > 0.1 else "#f1fa8c" if error_rate > 0 else "#50fa7b"
+        
+        table.add_row(
+            check['name'],
+            current,
+            _format_ms(window.percentile(50)),
+            _format_ms(window.percentile(95)),
+            _format_ms(window.percentile(99)),
+            f"[{error_color}]{error_rate:.0%}[/]",
+            str(window.remaining) if window.remaining is not None else "-",
+            str(len(window.samples))
+        )
+    
+    return table
+
+
+def watch_status(interval=10, export=None):
+    """Monitora latência das APIs continuamente (p50/p95/p99, erros e quota)."""
+    checks = [check for check in API_CHECKS if os.getenv(check['env'], '')]
+    if not checks:
+        console.print("❌ [#ff5555]Nenhuma API configurada para monitorar[/]")
+        return
+    
+    # client.get reaproveita as conexões keep-alive de cada host entre as amostras
+    windows = {check['name']: LatencyWindow() for check in checks}
+    cycles = {check['name']: watch_cycles(check, interval) for check in checks}
+    export_file = open(export, 'a', encoding='utf-8') if export else None
+    
+    console.print()
+    console.print("📈 STATUS --WATCH", style="bold #bd93f9")
+    console.print("═" * 50, style="#6272a4")
+    console.print()
     
-    return missing
+    for check in checks:
+        if 3600 / interval > check['quota_per_hour']:
+            console.print(f"⚠️  [#f1fa8c]{check['name']}: intervalo de {interval:g}s daria "
+                          f"{3600 / interval:.0f} req/h (quota {check['quota_per_hour']}/h); "
+                          f"amostrando a cada {cycles[check['name']]} ciclos[/]")
+    
+    try:
+        with ThreadPoolExecutor(max_workers=len(checks)) as executor, \
+                Live(_build_watch_table(checks, windows, interval, cycles), console=console,
+                     auto_refresh=False) as live:
+            cycle = 0
+            while True:
+                started = time.monotonic()
+                futures = [tracing.submit(executor, sample_api, check, min(interval, PROBE_DEADLINE))
+                           for check in checks if cycle % cycles[check['name']] == 0]
+                cycle += 1
+                
+                for future in as_completed(futures):
+                    sample = future.result()
+                    windows[sample['api']].add(sample)
+                    if export_file:
+                        export_file.write(json.dumps(sample) + '\n')
+                    live.update(_build_watch_table(checks, windows, interval, cycles), refresh=True)
+                
+                if export_file:
+                    export_file.flush()
+                
+                time.sleep(max(0, interval - (time.monotonic() - started)))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        if export_file:
+            export_file.close()
+
+
+def check_dependencies():
+    """Verifica dependências instaladas."""
+    return [dep for dep, version in get_dependency_versions().items() if not version]
 
 
 # Manter compatibilidade
@@ -0,0 +1,306 @@
+"""Tracing - Registro de spans de HTTP, subprocessos e disco."""
+
+import json
+import os
+import re
+import subprocess
+import threading
+import time
+from contextlib import contextmanager
+from urllib.parse import urlsplit
+
+import requests
+
+_spans = []
+_lock = threading.Lock()
+_local = threading.local()
+_enabled = False
+_started_at = None
+
+
+def enable():
+    """Liga o registro de spans (chamado por --profile/--trace)."""
+    global _enabled, _started_at
+    _enabled = True
+    _started_at = time.time()
+
+
+def reset():
+    """Desliga o registro e descarta os spans (daemon, entre comandos)."""
+    global _enabled, _started_at
+    _enabled = False
+    _started_at = None
+    with _lock:
+        _spans.clear()
+
+
+def is_enabled():
+    return _enabled
+
+
+def start_capture():
+    """Liga o registro num processo filho, descartando spans herdados do pai."""
+    global _enabled
+    _enabled = True
+    with _lock:
+        _spans.clear()
+
+
+def drain():
+    """Retorna e remove os spans registrados até agora."""
+    with _lock:
+        spans = list(_spans)
+        _spans.clear()
+    return spans
+
+
+def extend(spans):
+    """Adiciona spans vindos de outro processo (ex.: pool de processos)."""
+    with _lock:
+        _spans.extend(spans)
+
+
+def mark_queued(submitted_at):
+    """Informa quando a tarefa da thread atual entrou na fila.
+    
+    O próximo span registrado nesta thread usa esse instante para calcular
+    ``queue_ms`` (tempo esperando um worker livre).
+    """
+    _local.queued_at = submitted_at
+
+
+def submit(executor, fn, *args, **kwargs):
+    """``executor.submit`` que mede o tempo de fila até um worker pegar a tarefa."""
+    submitted_at = time.perf_counter()
+    
+    def task():
+        mark_queued(submitted_at)
+        return fn(*args, **kwargs)
+    
+    return executor.submit(task)
+
+
+def _take_queue_wait(start):
+    queued_at = getattr(_local, 'queued_at', None)
+    if queued_at is None:
+        return 0.0
+    _local.queued_at = None
+    return max(0.0, (start - queued_at) * 1000)
+
+
+def record(kind, name, ts, duration_ms, **attrs):
+    """Registra um span já medido (``ts`` em epoch, ``duration_ms`` em ms)."""
+    if not _enabled:
+        return
+    span = {
+        'kind': kind,
+        'name': name,
+        'ts': ts,
+        'duration_ms': round(duration_ms, 3),
+        'pid': os.getpid(),
+        'tid': threading.get_ident(),
+        **attrs
+    }
+    with _lock:
+        _spans.append(span)
+
+
+@contextmanager
+def span(kind, name, **attrs):
+    """Mede um bloco de código; o dict retornado aceita atributos extras."""
+    if not _enabled:
+        yield attrs
+        return
+    ts = time.time()
+    start = time.perf_counter()
+    attrs['queue_ms'] = round(_take_queue_wait(start), 3)
+    try:
+        yield attrs
+    finally:
+        record(kind, name, ts, (time.perf_counter() - start) * 1000, **attrs)
+
+
+def endpoint_of(url):
+    """Host + caminho, sem query string (tokens e assinaturas ficam de fora)."""
+    parts = urlsplit(url)
+    return f"{parts.netloc}{parts.path}"
+
+
+def request(method, url, session=None, **kwargs):
+    """``requests.request`` com registro de span (status, bytes, latência, retries)."""
+    if not _enabled:
+        return (session or requests).request(method, url, **kwargs)
+    
+    ts = time.time()
+    start = time.perf_counter()
+    attrs = {
+        'method': method.upper(),
+        'endpoint': endpoint_of(url),
+        'status': None,
+        'bytes': 0,
+        'retries': 0,
+        'queue_ms': round(_take_queue_wait(start), 3)
+    }
+    
+    try:
+        response = (session or requests).request(method, url, **kwargs)
+    except requests.RequestException as e:
+        attrs['error'] = type(e).__name__
+        record('http', f"{attrs['method']} {attrs['endpoint']}", ts,
+               (time.perf_counter() - start) * 1000, **attrs)
+        raise
+    
+    attrs['status'] = response.status_code
+    if kwargs.get('stream'):
+        # Corpo ainda não lido: usar o tamanho anunciado
+        attrs['bytes'] = int(response.headers.get('Content-Length') or 0)
+        attrs['streamed'] = True
+    else:
+        attrs['bytes'] = len(response.content)
+    
+    retries = getattr(response.raw, 'retries', None)
+    if retries is not None:
+        attrs['retries'] = len(retries.history)
+    
+    record('http', f"{attrs['method']} {attrs['endpoint']}", ts,
+           (time.perf_counter() - start) * 1000, **attrs)
+    return response
+
+
+def get(url, **kwargs):
+    return request('GET', url, **kwargs)
+
+
+def post(url, **kwargs):
+    return request('POST', url, **kwargs)
+
+
+def run(cmd, **kwargs):
+    """``subprocess.run`` com registro de span."""
+    if not _enabled:
+        return subprocess.run(cmd, **kwargs)
+    
+    args = [str(c) for c in cmd]
+    if args[0] == 'git' and '-C' in args:
+        # git -C <dir> <subcomando>: agrupar pelo subcomando
+        args = ['git'] + args[args.index('-C') + 2:]
+    name = ' '.join(args[:2]) if len(args) > 1 and not args[1].startswith('-') else args[0]
+    
+    with span('subprocess', name, command=' '.join(str(c) for c in cmd)[:200]) as attrs:
+        result = subprocess.run(cmd, **kwargs)
+        attrs['returncode'] = result.returncode
+        if isinstance(result.stdout, (str, bytes)):
+            attrs['bytes'] = len(result.stdout)
+    return result
+
+
+def _group_key(span):
+    """Agrupa spans por tipo + endpoint, trocando segmentos com dígitos por :id."""
+    if span['kind'] == 'http':
+        host, _, path = span['endpoint'].partition('/')
+        path = '/'.join(':id' if re.search(r'\d', part) else part for part in path.split('/'))
+        return f"{span['method']} {host}/{path}"
+    return span['name']
+
+
+def _busy_ms(spans):
+    """Tempo total coberto por spans (intervalos sobrepostos contam uma vez)."""
+    intervals = sorted((s['ts'], s['ts'] + s['duration_ms'] / 1000) for s in spans)
+    total = 0.0
+    current_start = current_end = None
+    for start, end in intervals:
+        if current_end is None or start > current_end:
+            if current_end is not None:
+                total += current_end - current_start
+            current_start, current_end = start, end
+        else:
+            current_end = max(current_end, end)
+    if current_end is not None:
+        total += current_end - current_start
+    return total * 1000
+
+
+def print_summary(console=None):
+    """Imprime a tabela de --profile agrupada por endpoint/comando."""
+    from rich.console import Console
+    from rich.table import Table
+    
+    console = console or Console(stderr=True)
+    spans = list(_spans)
+    wall_ms = (time.time() - _started_at) * 1000 if _started_at else 0
+    
+    groups = {}
+    for s in spans:
+        groups.setdefault((s['kind'], _group_key(s)), []).append(s)
+    
+    table = Table(show_header=True, header_style="#bd93f9", border_style="#6272a4",
+                  title="[#bd93f9]Profile[/]")
+    table.add_column("Tipo", style="#6272a4", no_wrap=True)
+    table.add_column("Endpoint / comando", style="#8be9fd")
+    table.add_column("N", justify="right")
+    table.add_column("Total", justify="right", style="#f1fa8c")
+    table.add_column("Máx", justify="right")
+    table.add_column("KB", justify="right", style="#bd93f9")
+    table.add_column("Fila", justify="right")
+    table.add_column("Retry", justify="right")
+    table.add_column("Erro", justify="right", style="#ff5555")
+    
+    ordered = sorted(groups.items(), key=lambda item: -sum(s['duration_ms'] for s in item[1]))
+    for (kind, key), items in ordered:
+        durations = [s['duration_ms'] for s in items]
+        errors = sum(1 for s in items if s.get('error') or (s.get('status') or 0) >= 400
+                     or s.get('returncode', 0) != 0)
+        table.add_row(
+            kind,
+            key if len(key) <= 32 else f"…{key[-31:]}",
+            str(len(items)),
+            f"{sum(durations):.0f}ms",
+            f"{max(durations):.0f}ms",
+            str(sum(s.get('bytes') or 0 for s in items) // 1024),
+            f"{sum(s.get('queue_ms') or 0 for s in items):.0f}ms",
+            str(sum(s.get('retries') or 0 for s in items)),
+            str(errors) if errors else ""
+        )
+    
+    other_ms = max(0.0, wall_ms - _busy_ms(spans))
+    table.add_row("python", "[#6272a4](fora de spans)[/]", "", f"{other_ms:.0f}ms",
+                  "", "", "", "", "")
+    table.caption = f"Tempo total: {wall_ms:.0f}ms · {len(spans)} spans"
+    table.caption_style = "#6272a4"
+    
+    console.print()
+    console.print(table)
+
+
+def to_chrome_events(spans=None):
+    """Converte spans para eventos "X" do formato Chrome trace (ts/dur em µs)."""
+    events = []
+    for s in (_spans if spans is None else spans):
+        args = {k: v for k, v in s.items() if k not in ('kind', 'name', 'ts', 'duration_ms', 'pid', 'tid')}
+        events.append({
+            'name': s['name'],
+            'cat': s['kind'],
+            'ph': 'X',
+            'ts': int(s['ts'] * 1_000_000),
+            'dur': int(s['duration_ms'] * 1000),
+            'pid': s['pid'],
+            'tid': s['tid'],
+            'args': args
+        })
+    return events
+
+
+def write_trace(path):
+    """Grava os spans em ``path``.
+    
+    ``.jsonl`` grava um evento Chrome trace por linha; qualquer outra
+    extensão grava ``{"traceEvents": [...]}``, que abre direto no
+    chrome://tracing e no Perfetto.
+    """
+    events = to_chrome_events()
+    with open(path, 'w', encoding='utf-8') as f:
+        if str(path).endswith('.jsonl'):
+            for event in events:
+                f.write(json.dumps(event) + '\n')
+        else:
+            json.dump({'traceEvents': events, 'displayTimeUnit': 'ms'}, f)
@@ -0,0 +1,227 @@
+"""Verify - Confere os downloads contra o manifesto e baixa de novo os que falharem."""
+
+import hashlib
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+from rich.console import Console
+from rich.panel import Panel
+from rich.progress import Progress
+from rich.table import Table
+
+from . import download, tracing
+from . import layout as output_layout
+
+console = Console()
+
+# hashlib libera o GIL em blocos grandes: threads leem e calculam em paralelo
+VERIFY_WORKERS = min(32, (os.cpu_count() or 1) * 2)
+READ_BUFFER = 4 * 1024 * 1024
+
+# Downloads simultâneos ao reparar
+REPAIR_WORKERS = 4
+
+OK = 'ok'
+MISSING = 'missing'
+SIZE = 'size'
+HASH = 'hash'
+UNREADABLE = 'unreadable'
+
+PROBLEM_LABELS = {
+    MISSING: "[#ff5555]Faltando[/]",
+    SIZE: "[#ff5555]Tamanho errado[/]",
+    HASH: "[#ff5555]Hash diferente[/]",
+    UNREADABLE: "[#ff5555]Ilegível[/]",
+}
+
+
+def load_manifests(root):
+    """Entradas de todos os ``manifest.ndjson`` sob ``root``: ``[(pasta, entrada)]``.
+    
+    Um arquivo gravado mais de uma vez aparece várias vezes no manifesto;
+    vale a última linha.
+    """
+    entries = {}
+    for manifest in sorted(Path(root).rglob(output_layout.MANIFEST_NAME)):
+        with open(manifest, encoding='utf-8') as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    # Linha cortada (processo morto no meio da escrita)
+                    continue
+                entries[(manifest.parent, entry['path'])] = entry
+    return [(directory, entry) for (directory, _), entry in entries.items()]
+
+
+def hash_file(path):
+    """Tamanho e SHA-256 de ``path`` lendo em blocos grandes num buffer reaproveitado."""
+    sha256 = hashlib.sha256()
+    buffer = bytearray(READ_BUFFER)
+    view = memoryview(buffer)
+    size = 0
+    with open(path, 'rb', buffering=0) as f:
+        while True:
+            n = f.readinto(buffer)
+            if not n:
+                break
+            sha256.update(view[:n])
+            size += n
+    return size, sha256.hexdigest()
+
+
+def check_entry(directory, entry):
+    """Estado de um arquivo do manifesto: ``OK``, ``MISSING``, ``SIZE``, ``HASH`` ou ``UNREADABLE``.
+    
+    Erros de leitura (permissão, diretório no lugar do arquivo, I/O) viram
+    ``UNREADABLE`` em vez de interromper a verificação inteira.
+    """
+    path = Path(directory) / entry['path']
+    try:
+        if entry.get('bytes') is not None and path.stat().st_size != entry['bytes']:
+            return SIZE
+        if not entry.get('sha256'):
+            # Manifestos antigos, sem hash: só dá para conferir o tamanho
+            return OK
+        size, sha256 = hash_file(path)
+    except FileNotFoundError:
+        return MISSING
+    except OSError:
+        return UNREADABLE
+    return OK if sha256 == entry['sha256'] else HASH
+
+
+def verify_tree(root='.', repair=True):
+    """Confere todos os arquivos dos manifestos sob ``root`` e repara os com problema."""
+    entries = load_manifests(root)
+    if not entries:
+        raise Exception(f"Nenhum {output_layout.MANIFEST_NAME} encontrado em {root}")
+    
+    problems = []
+    with Progress() as progress:
+        task = progress.add_task("[#bd93f9]Verificando arquivos...", total=len(entries))
+        with ThreadPoolExecutor(max_workers=VERIFY_WORKERS) as executor:
+            futures = {tracing.submit(executor, check_entry, directory, entry): (directory, entry)
+                       for directory, entry in entries}
+            for future in as_completed(futures):
+                status = future.result()
+                if status != OK:
+                    problems.append((*futures[future], status))
+                progress.advance(task)
+    
+    repaired = []
+    failed = []
+    if problems and repair:
+        repaired, failed = repair_entries(problems)
+    elif problems:
+        failed = [(directory, entry, "Não reparado (--no-repair)") for directory, entry, _ in problems]
+    
+    _show_results(len(entries), problems, repaired, failed)
+    
+    if failed:
+        raise Exception(f"{len(failed)} arquivos continuam com problema")
+    return {'checked': len(entries), 'problems': len(problems), 'repaired': len(repaired)}
+
+
+def repair_entries(problems):
+    """Baixa de novo os arquivos com problema; retorna ``(reparados, falhas)``."""
+    repaired = []
+    failed = []
+    
+    # Renders do Figma expiram: pedir URLs novas, uma vez por arquivo/formato/escala
+    figma_urls = _refresh_figma_urls([entry for _, entry, _ in problems if entry.get('source') == 'figma'])
+    
+    with Progress() as progress:
+        task = progress.add_task("[#bd93f9]Reparando arquivos...", total=len(problems))
+        with ThreadPoolExecutor(max_workers=REPAIR_WORKERS) as executor:
+            futures = {tracing.submit(executor, _refetch, directory, entry, figma_urls): (directory, entry)
+                       for directory, entry, _ in problems}
+            for future in as_completed(futures):
+                directory, entry = futures[future]
+                try:
+                    repaired.append((directory, entry, future.result()))
+                except Exception as e:
+                    failed.append((directory, entry, str(e)))
+                progress.advance(task)
+    
+    return repaired, failed
+
+
+def _refresh_figma_urls(entries):
+    if not entries:
+        return {}
+    
+    from . import figclone
+    
+    urls = {}
+    groups = {}
+    for entry in entries:
+        if entry.get('file_key') and entry.get('format'):
+            key = (entry['file_key'], entry['format'], entry.get('scale') or 1.0)
+            groups.setdefault(key, []).append(entry['id'])
+    
+    for (file_key, format_type, scale), node_ids in groups.items():
+        try:
+            images = figclone.request_exports(file_key, node_ids, format_type, scale)
+        except Exception as e:
+            console.print(f"  ⚠️  [#f1fa8c]Não foi possível renovar as URLs do Figma ({file_key}): {e}[/]")
+            continue
+        for node_id, url in images.items():
+            if url:
+                urls[(file_key, node_id, format_type)] = url
+    return urls
+
+
+def _refetch(directory, entry, figma_urls):
+    """Baixa um arquivo de novo e registra a nova linha no manifesto."""
+    path = Path(directory) / entry['path']
+    path.parent.mkdir(parents=True, exist_ok=True)
+    
+    url = entry['url']
+    if entry.get('source') == 'figma':
+        url = figma_urls.get((entry.get('file_key'), entry['id'], entry.get('format')), url)
+    
+    if entry.get('source') == 'pexels-video':
+        result = download.download_file(url, path)
+    else:
+        result = download.fetch_to_file(url, path)
+    
+    output_layout.append_manifest(directory, {**entry, 'url': url, 'bytes': result['bytes'],
+                                              'sha256': result['sha256']})
+    
+    if entry.get('sha256') and result['sha256'] != entry['sha256']:
+        return "conteúdo mudou no servidor (hash atualizado)"
+    return "ok"
+
+
+def _show_results(checked, problems, repaired, failed):
+    if problems:
+        table = Table(show_header=True, header_style="#bd93f9", border_style="#6272a4")
+        table.add_column("Arquivo", style="#8be9fd")
+        table.add_column("Problema")
+        table.add_column("Resultado")
+        
+        status_by_path = {(directory, entry['path']): status for directory, entry, status in problems}
+        rows = [(d, e, f"[#50fa7b]✅ Reparado[/] [#6272a4]{note if note != 'ok' else ''}[/]") for d, e, note in repaired]
+        rows += [(d, e, f"[#ff5555]❌ {error}[/]") for d, e, error in failed]
+        
+        for directory, entry, result in rows[:20]:
+            status = status_by_path.get((directory, entry['path']))
+            table.add_row(str(Path(directory) / entry['path']), PROBLEM_LABELS.get(status, "-"), result)
+        console.print(table)
+        if len(rows) > 20:
+            console.print(f"  [#6272a4]... e mais {len(rows) - 20} arquivos[/]")
+    
+    color = "#ff5555" if failed else "#50fa7b"
+    console.print(Panel.fit(
+        f"[#f8f8f2]🔍 Verificados: {checked}[/]\n"
+        f"[#f8f8f2]✅ Íntegros: {checked - len(problems)}[/]\n"
+        f"[#f8f8f2]🔧 Reparados: {len(repaired)}[/]\n"
+        f"[#f8f8f2]❌ Com problema: {len(failed)}[/]",
+        title=f"[{color}]Verificação[/]",
+        border_style=color
+    ))